@@ -73,8 +73,41 @@ def _args_parser(args: list[str]) -> argparse.Namespace:
         "--judge_model", type=str, help="Judge model name for LLM-based evaluations"
     )
 
+    parser.add_argument(
+        "--additional_judges",
+        type=str,
+        nargs="+",
+        metavar="PROVIDER:MODEL",
+        help=(
+            "Additional judge models (e.g., azure:gpt-4o), "
+            "judge evaluations then pass by majority vote"
+        ),
+    )
+
+    parser.add_argument(
+        "--judge_constrained_output",
+        action="store_true",
+        help=(
+            "Restrict judge output to a single 0/1 token via logit_bias "
+            "(OpenAI/Azure judges only, not supported by reasoning models)"
+        ),
+    )
+
+    parser.add_argument(
+        "--judge_cache_dir",
+        type=str,
+        help="Directory to cache judge model responses (caching disabled if not set)",
+    )
+
     parser.add_argument("--kubeconfig", type=str, help="Path to the kubeconfig file")
 
+    parser.add_argument(
+        "--max_inflight",
+        type=int,
+        default=1,
+        help="Maximum number of conversation groups evaluated concurrently (default: 1)",
+    )
+
     parser.add_argument(
         "--result_dir",
         type=str,
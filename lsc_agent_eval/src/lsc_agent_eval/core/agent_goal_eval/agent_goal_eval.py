@@ -2,17 +2,19 @@
 
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from tqdm import tqdm
 
 from ..utils.api_client import AgentHttpClient
 from ..utils.exceptions import AgentEvaluationError, ScriptExecutionError
-from ..utils.judge import JudgeModelManager
+from ..utils.judge import JudgeEnsemble, JudgeModelManager, parse_judge_spec
 from .eval_data import AgentGoalEvalDataManager
 from .evaluator import EvaluationRunner
-from .results import ResultsManager
+from .results import ResultsManager, ResultsStream
 from .script_runner import ScriptRunner
 from .utils import create_evaluation_results
 
@@ -60,12 +62,34 @@ class AgentGoalEval:
         )
 
         # Judge model manager (optional)
-        self.judge_manager = None
+        self.judge_manager: Optional[Union[JudgeModelManager, JudgeEnsemble]] = None
         if self.eval_args.judge_provider and self.eval_args.judge_model:
+            cache_dir = getattr(self.eval_args, "judge_cache_dir", None)
+            constrain_output = getattr(
+                self.eval_args, "judge_constrained_output", False
+            )
             self.judge_manager = JudgeModelManager(
-                self.eval_args.judge_provider, self.eval_args.judge_model
+                self.eval_args.judge_provider,
+                self.eval_args.judge_model,
+                cache_dir=cache_dir,
+                constrain_output=constrain_output,
             )
 
+            # Additional judges turn judge evaluations into a majority vote
+            additional_judges = getattr(self.eval_args, "additional_judges", None)
+            if additional_judges:
+                self.judge_manager = JudgeEnsemble(
+                    [self.judge_manager]
+                    + [
+                        JudgeModelManager(
+                            *parse_judge_spec(spec),
+                            cache_dir=cache_dir,
+                            constrain_output=constrain_output,
+                        )
+                        for spec in additional_judges
+                    ]
+                )
+
         # Evaluation runner
         self.evaluation_runner = EvaluationRunner(
             self.agent_client, self.script_runner, self.judge_manager
@@ -82,20 +106,16 @@ class AgentGoalEval:
                 len(conversations),
             )
 
-            results = []
-
-            # Process each conversation for evaluation
-            for conv_idx, conversation in enumerate(conversations, 1):
-                print(
-                    f"\n📋 Conversation {conv_idx}/{len(conversations)}: "
-                    f"{conversation.conversation_group}"
-                )
-                conversation_results = self._process_conversation(conversation)
-                results.extend(conversation_results)
+            # Process each conversation for evaluation, results are written
+            # to CSV as soon as each evaluation completes
+            with ResultsManager.open_stream(
+                self.eval_args.result_dir
+            ) as results_stream:
+                results = self._process_conversations(conversations, results_stream)
 
-            # Save results
+            # Save summary
             results_manager = ResultsManager(results)
-            results_manager.save_results(self.eval_args.result_dir)
+            results_manager.save_summary(results_stream.json_file)
 
             # Print summary
             self._print_summary(results_manager)
@@ -107,8 +127,46 @@ class AgentGoalEval:
             # Clean up resources
             self._cleanup()
 
+    def _process_conversations(
+        self,
+        conversations: list["ConversationDataConfig"],
+        results_stream: ResultsStream,
+    ) -> list["EvaluationResult"]:
+        """Process all conversation groups, concurrently when max_inflight > 1.
+
+        Evaluations within a conversation share a conversation_id and always run
+        sequentially; only independent conversation groups are run concurrently.
+        Results are returned in conversation order regardless of completion order.
+        """
+        max_inflight = max(1, getattr(self.eval_args, "max_inflight", 1) or 1)
+
+        if max_inflight == 1:
+            results = []
+            for conv_idx, conversation in enumerate(conversations, 1):
+                print(
+                    f"\n📋 Conversation {conv_idx}/{len(conversations)}: "
+                    f"{conversation.conversation_group}"
+                )
+                results.extend(self._process_conversation(conversation, results_stream))
+            return results
+
+        print(
+            f"\n📋 Processing {len(conversations)} conversations "
+            f"({max_inflight} in flight)"
+        )
+        with ThreadPoolExecutor(max_workers=max_inflight) as executor:
+            conversation_results = executor.map(
+                partial(self._process_conversation, results_stream=results_stream),
+                conversations,
+            )
+            return [
+                result
+                for conv_results in conversation_results
+                for result in conv_results
+            ]
+
     def _process_conversation(
-        self, conversation: "ConversationDataConfig"
+        self, conversation: "ConversationDataConfig", results_stream: ResultsStream
     ) -> list["EvaluationResult"]:
         """Process single conversation group."""
         conversation_group = conversation.conversation_group
@@ -132,6 +190,7 @@ class AgentGoalEval:
                         error_message=f"Setup script failed: {str(e)}",
                         conversation_id=conversation_id,
                     )
+                    results_stream.extend(error_result)
                     results.extend(error_result)
                 print(f"❌ Setup script failed for {conversation_group}: {e}")
                 return results
@@ -139,7 +198,7 @@ class AgentGoalEval:
         # Run evaluations
         print(f"   Running {len(evaluations)} evaluations...")
         evaluation_results = self._run_conversation_evaluations(
-            evaluations, conversation_group, conversation_id
+            evaluations, conversation_group, conversation_id, results_stream
         )
         results.extend(evaluation_results)
 
@@ -174,6 +233,7 @@ class AgentGoalEval:
         evaluations: list["EvaluationDataConfig"],
         conversation_group: str,
         conversation_id: Optional[str],
+        results_stream: ResultsStream,
     ) -> list["EvaluationResult"]:
         """Run all evaluations for a conversation."""
         results = []
@@ -197,6 +257,7 @@ class AgentGoalEval:
                     print(f"  Received conversation ID from API: {conversation_id}")
 
                 self._print_individual_results(eval_data, eval_results, pbar)
+                results_stream.extend(eval_results)
                 results.extend(eval_results)
 
                 pbar.update(1)
@@ -288,8 +349,8 @@ class AgentGoalEval:
             print("\nSummary by Conversation:")
             for conv_group, counts in stats.by_conversation.items():
                 print(
-                    f"{conv_group}: {counts['passed']}/{counts['total']} "
-                    f"({counts['success_rate']:.1f}%)"
+                    f"{conv_group}: {counts.passed}/{counts.total} "
+                    f"({counts.success_rate:.1f}%)"
                 )
 
         print(f"{'='*25}\n")
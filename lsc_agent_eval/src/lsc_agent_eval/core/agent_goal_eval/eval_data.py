@@ -1,6 +1,7 @@
 """Agent Goal Eval data management."""
 
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -8,10 +9,13 @@ import yaml
 from pydantic import ValidationError
 
 from ..utils.exceptions import EvaluationDataError
-from .models import ConversationDataConfig
+from .models import CONVERSATION_LIST_ADAPTER, ConversationDataConfig
 
 logger = logging.getLogger(__name__)
 
+# Use libyaml C parser when PyYAML is built with it, pure-Python otherwise
+SafeYamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AgentGoalEvalDataManager:
     """Processes agent eval data and validation."""
@@ -31,7 +35,7 @@ class AgentGoalEvalDataManager:
             logger.info("Loading evaluation data from: %s", str(eval_data_path))
 
             with open(eval_data_path, "r", encoding="utf-8") as file:
-                raw_data = yaml.safe_load(file)
+                raw_data = yaml.load(file, Loader=SafeYamlLoader)
 
             if raw_data is None:
                 raise EvaluationDataError("Eval data file is empty")
@@ -62,55 +66,57 @@ class AgentGoalEvalDataManager:
         """Load conversation data."""
         logger.info("Processing conversation data...")
 
+        try:
+            conversations = CONVERSATION_LIST_ADAPTER.validate_python(raw_data)
+        except ValidationError as e:
+            raise EvaluationDataError(self._format_pydantic_error(raw_data, e)) from e
+
         self.conversations = []
         processed_groups = set()
 
-        for idx, conversation_data in enumerate(raw_data, 1):
-            logger.debug("Processing conversation %d", idx)
-
-            try:
-                conversation_config = ConversationDataConfig(**conversation_data)
-
-                # Check for duplicate conversation groups
-                if conversation_config.conversation_group in processed_groups:
-                    raise EvaluationDataError(
-                        "Duplicate conversation_group "
-                        f"'{conversation_config.conversation_group}' found"
-                    )
-                processed_groups.add(conversation_config.conversation_group)
+        for conversation_config in conversations:
+            # Check for duplicate conversation groups
+            if conversation_config.conversation_group in processed_groups:
+                raise EvaluationDataError(
+                    "Duplicate conversation_group "
+                    f"'{conversation_config.conversation_group}' found"
+                )
+            processed_groups.add(conversation_config.conversation_group)
 
-                # Store the conversation
-                self.conversations.append(conversation_config)
+            # Store the conversation
+            self.conversations.append(conversation_config)
 
-                logger.info(
-                    "Loaded conversation '%s' with %d evaluations",
-                    conversation_config.conversation_group,
-                    len(conversation_config.conversation),
-                )
+            logger.info(
+                "Loaded conversation '%s' with %d evaluations",
+                conversation_config.conversation_group,
+                len(conversation_config.conversation),
+            )
 
-            except ValidationError as e:
-                error_details = self._format_pydantic_error(e)
-                conversation_group = conversation_data.get(
-                    "conversation_group", f"conversation_{idx}"
-                )
-                raise EvaluationDataError(
-                    f"Validation error in conversation '{conversation_group}': {error_details}"
-                ) from e
-            except EvaluationDataError:
-                raise
-            except Exception as e:
-                raise EvaluationDataError(
-                    f"Error processing conversation {idx}: {e}"
-                ) from e
+    def _format_pydantic_error(
+        self, raw_data: list[dict[str, Any]], error: ValidationError
+    ) -> str:
+        """Format Pydantic validation error of the first invalid conversation."""
+        # Error locations start with the conversation index in the file
+        error_list = error.errors()
+        idx = int(error_list[0]["loc"][0])
+        conversation_data = raw_data[idx]
+        conversation_group = f"conversation_{idx + 1}"
+        if isinstance(conversation_data, dict):
+            conversation_group = conversation_data.get(
+                "conversation_group", conversation_group
+            )
 
-    def _format_pydantic_error(self, error: ValidationError) -> str:
-        """Format Pydantic validation error."""
         errors = []
-        for err in error.errors():
-            field = " -> ".join(str(loc) for loc in err["loc"])
+        for err in error_list:
+            if err["loc"][0] != idx:
+                continue
+            field = " -> ".join(str(loc) for loc in err["loc"][1:])
             message = err["msg"]
-            errors.append(f"{field}: {message}")
-        return "; ".join(errors)
+            errors.append(f"{field}: {message}" if field else message)
+        error_details = "; ".join(errors)
+        return (
+            f"Validation error in conversation '{conversation_group}': {error_details}"
+        )
 
     def _log_loaded_data_stats(self) -> None:
         """Log statistics about loaded data."""
@@ -135,19 +141,17 @@ class AgentGoalEvalDataManager:
             raise EvaluationDataError("No valid evaluations found in eval data file")
 
         # Check for duplicate eval_ids across all conversations
-        all_eval_ids = []
-        for conversation in self.conversations:
-            all_eval_ids.extend(
-                [eval_config.eval_id for eval_config in conversation.conversation]
-            )
-
-        duplicate_ids = [
-            eval_id for eval_id in all_eval_ids if all_eval_ids.count(eval_id) > 1
-        ]
+        eval_id_counts = Counter(
+            eval_config.eval_id
+            for conversation in self.conversations
+            for eval_config in conversation.conversation
+        )
+        duplicate_ids = {
+            eval_id for eval_id, count in eval_id_counts.items() if count > 1
+        }
         if duplicate_ids:
             logger.warning(
-                "Duplicate eval_id(s) found across conversations: %s",
-                set(duplicate_ids),
+                "Duplicate eval_id(s) found across conversations: %s", duplicate_ids
             )
 
         logger.info("✅ Data validation complete:")
@@ -1,16 +1,22 @@
 """Evaluation runner that orchestrates different evaluation types."""
 
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
+from ..utils.constants import JUDGE_VERDICTS
 from ..utils.exceptions import AgentAPIError, JudgeModelError, ScriptExecutionError
-from ..utils.prompt import ANSWER_CORRECTNESS_PROMPT, INTENT_DETECTION_PROMPT
+from ..utils.judge import JudgeEnsemble, JudgeModelManager
+from ..utils.prompt import (
+    ANSWER_CORRECTNESS_SYSTEM_PROMPT,
+    ANSWER_CORRECTNESS_USER_PROMPT,
+    INTENT_DETECTION_SYSTEM_PROMPT,
+    INTENT_DETECTION_USER_PROMPT,
+)
 from .tool_call_eval import compare_tool_calls
 from .utils import EvalResultItem, create_evaluation_results
 
 if TYPE_CHECKING:
     from ..utils.api_client import AgentHttpClient
-    from ..utils.judge import JudgeModelManager
     from .models import EvaluationDataConfig, EvaluationResult
     from .script_runner import ScriptRunner
 
@@ -24,7 +30,7 @@ class EvaluationRunner:
         self,
         agent_client: "AgentHttpClient",
         script_runner: "ScriptRunner",
-        judge_manager: Optional["JudgeModelManager"] = None,
+        judge_manager: Optional[Union[JudgeModelManager, JudgeEnsemble]] = None,
     ):
         """Initialize evaluation runner."""
         self.agent_client = agent_client
@@ -143,23 +149,16 @@ class EvaluationRunner:
         self, data_config: "EvaluationDataConfig", response: str
     ) -> bool:
         """Evaluate using substring matching."""
-        if not data_config.expected_keywords:
-            return False
-
-        response_lower = response.lower()
         # All keywords must be present for evaluation to pass
-        for keyword in data_config.expected_keywords:
-            if keyword.lower() not in response_lower:
-                return False
-        return True
+        return data_config.matches_all_keywords(response)
 
     def _extract_numeric_result(self, response: Optional[str]) -> int:
         """Extract numeric result from judge response."""
-        # Look for 1 or 0 in the response
+        # Judge response must be exactly 1 or 0, no extraction from free text
         if response:
             response = response.strip()
 
-        if response not in ["0", "1"]:
+        if response not in JUDGE_VERDICTS:
             raise JudgeModelError(
                 "Invalid response from the judge model. "
                 f"Expected value either 0/1. Actual value: {response}"
@@ -167,6 +166,25 @@ class EvaluationRunner:
 
         return int(response)
 
+    def _get_judge_verdict(self, prompt: str, system_prompt: str) -> bool:
+        """Get judge verdict, by strict majority vote for a judge ensemble."""
+        if isinstance(self.judge_manager, JudgeEnsemble):
+            judge_responses = self.judge_manager.evaluate_responses(
+                prompt, system_prompt=system_prompt
+            )
+        elif self.judge_manager:
+            judge_responses = [
+                self.judge_manager.evaluate_response(
+                    prompt, system_prompt=system_prompt
+                )
+            ]
+        else:
+            raise JudgeModelError("Judge model manager not available")
+
+        # Extract numeric result (looking for 1 or 0) from every judge
+        votes = [self._extract_numeric_result(resp) for resp in judge_responses]
+        return sum(votes) * 2 > len(votes)
+
     def _evaluate_judge_llm(
         self, data_config: "EvaluationDataConfig", response: str
     ) -> bool:
@@ -180,16 +198,12 @@ class EvaluationRunner:
             return False
 
         # Format prompt with parameters
-        prompt = ANSWER_CORRECTNESS_PROMPT.format(
+        prompt = ANSWER_CORRECTNESS_USER_PROMPT.format(
             question=data_config.eval_query,
             answer=data_config.expected_response,
             response=response,
         )
-        judge_resp = self.judge_manager.evaluate_response(prompt)
-
-        # Extract numeric result (looking for 1 or 0)
-        result = self._extract_numeric_result(judge_resp)
-        return result == 1
+        return self._get_judge_verdict(prompt, ANSWER_CORRECTNESS_SYSTEM_PROMPT)
 
     def _evaluate_intent(
         self, data_config: "EvaluationDataConfig", response: str
@@ -215,16 +229,12 @@ class EvaluationRunner:
             return False
 
         # Format prompt with parameters
-        prompt = INTENT_DETECTION_PROMPT.format(
+        prompt = INTENT_DETECTION_USER_PROMPT.format(
             question=data_config.eval_query,
             intent=data_config.expected_intent,
             response=response,
         )
-        judge_resp = self.judge_manager.evaluate_response(prompt)
-
-        # Extract numeric result (looking for 1 or 0)
-        result = self._extract_numeric_result(judge_resp)
-        return result == 1
+        return self._get_judge_verdict(prompt, INTENT_DETECTION_SYSTEM_PROMPT)
 
     def _evaluate_tools(
         self,
@@ -240,6 +250,8 @@ class EvaluationRunner:
 
         return compare_tool_calls(data_config.expected_tool_calls, actual_tool_calls)
 
-    def get_judge_manager(self) -> Optional["JudgeModelManager"]:
+    def get_judge_manager(
+        self,
+    ) -> Optional[Union[JudgeModelManager, JudgeEnsemble]]:
         """Get the judge model manager."""
         return self.judge_manager
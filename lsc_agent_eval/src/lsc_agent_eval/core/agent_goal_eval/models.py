@@ -1,11 +1,30 @@
 """Data models for agent evaluation."""
 
+import os
+import stat
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
-
-from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
+from typing import Annotated, Any, Optional, Union
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 VALID_EVAL_RESULTS = ["PASS", "FAIL", "ERROR"]
+# Set form for membership checks; the list keeps error messages ordered
+VALID_EVAL_RESULTS_SET = frozenset(VALID_EVAL_RESULTS)
 EVAL_TYPE_REQUIREMENTS = {
     "response_eval:accuracy": (
         "expected_response",
@@ -24,11 +43,16 @@ EVAL_TYPE_REQUIREMENTS = {
 }
 
 
-def _validate_eval_type(eval_type: str) -> str:
-    """Validate evaluation type."""
-    if not isinstance(eval_type, str):
-        raise ValueError(f"eval_type must be a string, got {type(eval_type).__name__}")
+class ResultCode(IntEnum):
+    """Integer code of an evaluation result, used as statistics counter index."""
+
+    PASS = 0
+    FAIL = 1
+    ERROR = 2
 
+
+def _validate_eval_type(eval_type: str) -> str:
+    """Validate evaluation type, returning the interned eval type string."""
     eval_type = eval_type.strip()
     if not eval_type:
         raise ValueError("eval_type cannot be empty")
@@ -37,7 +61,20 @@ def _validate_eval_type(eval_type: str) -> str:
         allowed = ", ".join(sorted(EVAL_TYPE_REQUIREMENTS.keys()))
         raise ValueError(f"eval_type must be one of [{allowed}], got '{eval_type}'")
 
-    return eval_type
+    # Few distinct values, shared by every config and result as stats keys
+    return sys.intern(eval_type)
+
+
+# Evaluation type, validated as part of the compiled field schema
+EvalType = Annotated[str, AfterValidator(_validate_eval_type)]
+# String constraints shared by config and result fields
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+ShortDescription = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+
+
+def _normalize_conversation_group(conversation_group: str) -> str:
+    """Strip conversation group name, interning it as it is shared by evaluations."""
+    return sys.intern(conversation_group.strip())
 
 
 def _validate_script_path(
@@ -52,13 +89,19 @@ def _validate_script_path(
             script_file = Path(script_file)
 
         # Convert to absolute path
-        script_path = script_file.resolve()
-
-        # Validate file exists
-        if not script_path.exists():
-            raise ValueError(f"{script_name} file not found: {script_path}")
+        script_path = Path(os.path.abspath(script_file))
+
+        # Validate file exists and is a regular file with a single stat call
+        try:
+            st_mode = os.stat(script_path).st_mode
+        except FileNotFoundError as e:
+            raise ValueError(f"{script_name} file not found: {script_path}") from e
+        except OSError as e:
+            raise ValueError(
+                f"{script_name} file cannot be accessed: {script_path} ({e.strerror})"
+            ) from e
 
-        if not script_path.is_file():
+        if not stat.S_ISREG(st_mode):
             raise ValueError(f"{script_name} is not a file: {script_path}")
 
         return script_path
@@ -66,31 +109,31 @@ def _validate_script_path(
     return None
 
 
-def _calculate_stats_by_category(
-    results: list["EvaluationResult"],
-    key_extractor: Callable[["EvaluationResult"], str],
-) -> dict[str, dict[str, Union[int, float]]]:
-    """Calculate statistics grouped by a category from each result."""
-    category_stats: dict[str, dict[str, Union[int, float]]] = {}
-
-    for result in results:
-        category = key_extractor(result)
-        if category not in category_stats:
-            category_stats[category] = {"passed": 0, "failed": 0, "errored": 0}
-
-        if result.result == "PASS":
-            category_stats[category]["passed"] += 1
-        elif result.result == "FAIL":
-            category_stats[category]["failed"] += 1
-        elif result.result == "ERROR":
-            category_stats[category]["errored"] += 1
-
-    # Calculate success rates
-    for stats in category_stats.values():
-        total = stats["passed"] + stats["failed"] + stats["errored"]
-        stats["total"] = total
-        stats["success_rate"] = (
-            round((stats["passed"] / total) * 100, 2) if total > 0 else 0.0
+@dataclass(slots=True)
+class CategoryStats:
+    """Evaluation statistics of a single conversation group or eval type."""
+
+    passed: int
+    failed: int
+    errored: int
+    total: int
+    success_rate: float
+
+
+def _build_category_stats(
+    category_counts: dict[str, list[int]],
+) -> dict[str, CategoryStats]:
+    """Build statistics with success rates from per-category result counts."""
+    category_stats = {}
+
+    for category, (passed, failed, errored) in category_counts.items():
+        total = passed + failed + errored
+        category_stats[category] = CategoryStats(
+            passed=passed,
+            failed=failed,
+            errored=errored,
+            total=total,
+            success_rate=round((passed / total) * 100, 2) if total > 0 else 0.0,
         )
 
     return category_stats
@@ -99,9 +142,11 @@ def _calculate_stats_by_category(
 class EvaluationDataConfig(BaseModel):
     """Single evaluation data configuration."""
 
-    eval_id: str = Field(..., min_length=1, description="Unique evaluation identifier")
-    eval_query: str = Field(..., min_length=1, description="Query to send to the agent")
-    eval_types: list[str] = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    eval_id: NonEmptyStr = Field(..., description="Unique evaluation identifier")
+    eval_query: NonEmptyStr = Field(..., description="Query to send to the agent")
+    eval_types: list[EvalType] = Field(
         ...,
         min_length=1,
         description=(
@@ -110,15 +155,14 @@ class EvaluationDataConfig(BaseModel):
             "response_eval:accuracy, response_eval:intent"
         ),
     )
-    expected_response: Optional[str] = Field(
-        None, min_length=1, description="Expected response for judge-llm"
+    expected_response: Optional[NonEmptyStr] = Field(
+        None, description="Expected response for judge-llm"
     )
     expected_keywords: Optional[list[str]] = Field(
         None, min_length=1, description="List of expected keywords for sub-string"
     )
-    expected_intent: Optional[str] = Field(
+    expected_intent: Optional[NonEmptyStr] = Field(
         None,
-        min_length=1,
         description=(
             "Expected intent/purpose of the LLM's response "
             "(e.g., 'provide instructions', 'explain concept', 'refuse request')"
@@ -130,31 +174,19 @@ class EvaluationDataConfig(BaseModel):
     eval_verify_script: Optional[Path] = Field(
         None, description="Script path for script evaluation"
     )
-    conversation_group: Optional[str] = Field(None, min_length=1)
-    description: Optional[str] = Field(
-        None, min_length=1, max_length=500, description="Description of this evaluation"
+    conversation_group: Optional[NonEmptyStr] = None
+    description: Optional[ShortDescription] = Field(
+        None, description="Description of this evaluation"
     )
 
     @field_validator("eval_types")
     @classmethod
     def validate_eval_types(cls, v: list[str]) -> list[str]:
-        """Validate evaluation types."""
+        """Remove duplicate evaluation types while preserving order."""
         if not v:
             raise ValueError("eval_types cannot be empty")
 
-        # Validate each type and remove duplicates while preserving order
-        validated_types = []
-        seen = set()
-        for eval_type in v:
-            validated_type = _validate_eval_type(eval_type)
-            if validated_type not in seen:
-                validated_types.append(validated_type)
-                seen.add(validated_type)
-
-        if not validated_types:
-            raise ValueError("No valid eval_types provided")
-
-        return validated_types
+        return list(dict.fromkeys(v))
 
     @field_validator("expected_keywords")
     @classmethod
@@ -169,6 +201,24 @@ class EvaluationDataConfig(BaseModel):
                 raise ValueError("expected_keywords cannot be empty after filtering")
         return v
 
+    @cached_property
+    def expected_keywords_casefold(self) -> tuple[str, ...]:
+        """Unique casefolded expected keywords, computed once for sub-string matching."""
+        return tuple(
+            dict.fromkeys(
+                keyword.casefold() for keyword in self.expected_keywords or ()
+            )
+        )
+
+    def matches_all_keywords(self, response: str) -> bool:
+        """Check whether response contains all expected keywords, ignoring case."""
+        keywords = self.expected_keywords_casefold
+        if not keywords:
+            return False
+
+        response_casefold = response.casefold()
+        return all(keyword in response_casefold for keyword in keywords)
+
     @field_validator("eval_verify_script")
     @classmethod
     def validate_script_path(cls, v: Optional[Union[str, Path]]) -> Optional[Path]:
@@ -198,11 +248,8 @@ class ConversationDataConfig(BaseModel):
     conversation: list[EvaluationDataConfig] = Field(
         ..., min_length=1, description="List of evaluations in this conversation group"
     )
-    description: Optional[str] = Field(
-        None,
-        min_length=1,
-        max_length=500,
-        description="Description of this conversation group",
+    description: Optional[ShortDescription] = Field(
+        None, description="Description of this conversation group"
     )
     setup_script: Optional[Path] = Field(
         None, description="Setup script path for conversation group"
@@ -211,11 +258,38 @@ class ConversationDataConfig(BaseModel):
         None, description="Cleanup script path for conversation group"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def set_evaluation_conversation_group(cls, data: Any) -> Any:
+        """Set conversation group on every evaluation before it is built."""
+        if not isinstance(data, dict):
+            return data
+        conversation_group = data.get("conversation_group")
+        evaluations = data.get("conversation")
+        if not isinstance(conversation_group, str) or not isinstance(evaluations, list):
+            return data
+        conversation_group = _normalize_conversation_group(conversation_group)
+        if not conversation_group:
+            # Reported by the conversation_group field validator
+            return data
+
+        # Evaluations are frozen, so the group goes in with their input data.
+        # Already built evaluations are dumped, so they are validated again
+        # together with the group.
+        conversation = []
+        for eval_config in evaluations:
+            if isinstance(eval_config, EvaluationDataConfig):
+                eval_config = eval_config.model_dump(exclude_unset=True)
+            if isinstance(eval_config, dict):
+                eval_config = {**eval_config, "conversation_group": conversation_group}
+            conversation.append(eval_config)
+        return {**data, "conversation": conversation}
+
     @field_validator("conversation_group")
     @classmethod
     def validate_conversation_group(cls, v: str) -> str:
-        """Validate conversation group name."""
-        v = v.strip()
+        """Validate conversation group name, returning the interned name."""
+        v = _normalize_conversation_group(v)
         if not v:
             raise ValueError("conversation_group cannot be empty")
 
@@ -240,13 +314,15 @@ class ConversationDataConfig(BaseModel):
                 f"Conversation '{self.conversation_group}' must have at least one evaluation"
             )
 
-        # Set conversation group for all evaluations
-        for eval_config in self.conversation:
-            eval_config.conversation_group = self.conversation_group
+        # Single-turn conversations can't have duplicate eval_ids
+        if len(self.conversation) == 1:
+            return self
 
         # Check for duplicate eval_ids within conversation
-        eval_ids = [eval_config.eval_id for eval_config in self.conversation]
-        duplicates = [eval_id for eval_id in eval_ids if eval_ids.count(eval_id) > 1]
+        eval_id_counts = Counter(
+            eval_config.eval_id for eval_config in self.conversation
+        )
+        duplicates = [eval_id for eval_id, count in eval_id_counts.items() if count > 1]
         if duplicates:
             raise ValueError(
                 f"Duplicate eval_id(s) in conversation '{self.conversation_group}': {duplicates}"
@@ -255,16 +331,23 @@ class ConversationDataConfig(BaseModel):
         return self
 
 
+# Validates all conversations of an eval data file in one call, with the
+# core schema built once at import
+CONVERSATION_LIST_ADAPTER = TypeAdapter(list[ConversationDataConfig])
+
+
 class EvaluationResult(BaseModel):
     """Result of a single evaluation."""
 
-    eval_id: str = Field(..., min_length=1, description="Evaluation identifier")
-    query: str = Field(..., min_length=1, description="Query sent to agent")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    eval_id: NonEmptyStr = Field(..., description="Evaluation identifier")
+    query: NonEmptyStr = Field(..., description="Query sent to agent")
     response: str = Field(..., description="Agent response")
     tool_calls: Optional[list[list[dict[str, Any]]]] = Field(
         None, description="Tool calls made by agent (for tool_eval type)"
     )
-    eval_type: str = Field(..., description="Type of evaluation performed")
+    eval_type: EvalType = Field(..., description="Type of evaluation performed")
     result: str = Field(..., description="Evaluation result")
     conversation_group: Optional[str] = Field(None, description="Conversation group")
     conversation_id: Optional[str] = Field(None, description="Conversation ID")
@@ -277,15 +360,14 @@ class EvaluationResult(BaseModel):
     @classmethod
     def validate_result(cls, v: str) -> str:
         """Validate result is one of the allowed values."""
-        if v not in VALID_EVAL_RESULTS:
+        if v not in VALID_EVAL_RESULTS_SET:
             raise ValueError(f"Result must be one of {VALID_EVAL_RESULTS}, got '{v}'")
         return v
 
-    @field_validator("eval_type")
-    @classmethod
-    def validate_eval_type(cls, v: str) -> str:
-        """Validate evaluation type."""
-        return _validate_eval_type(v)
+    @cached_property
+    def result_code(self) -> ResultCode:
+        """Integer code of the result, computed once for statistics counting."""
+        return ResultCode[self.result]
 
 
 class EvaluationStats(BaseModel):
@@ -301,10 +383,10 @@ class EvaluationStats(BaseModel):
     success_rate: float = Field(
         ..., ge=0.0, le=100.0, description="Success rate percentage"
     )
-    by_conversation: dict[str, dict[str, Any]] = Field(
+    by_conversation: dict[str, CategoryStats] = Field(
         default_factory=dict, description="Statistics by conversation"
     )
-    by_eval_type: dict[str, dict[str, Any]] = Field(
+    by_eval_type: dict[str, CategoryStats] = Field(
         default_factory=dict, description="Statistics by evaluation type"
     )
 
@@ -312,31 +394,38 @@ class EvaluationStats(BaseModel):
     def from_results(cls, results: list[EvaluationResult]) -> "EvaluationStats":
         """Create comprehensive statistics from evaluation results."""
         total = len(results)
-        passed = sum(1 for r in results if r.result == "PASS")
-        failed = sum(1 for r in results if r.result == "FAIL")
-        errored = sum(1 for r in results if r.result == "ERROR")
+        result_counts = [0, 0, 0]
+        conversation_counts: dict[str, list[int]] = {}
+        eval_type_counts: dict[str, list[int]] = {}
+
+        # Single pass over results for overall, conversation and eval_type counts
+        for r in results:
+            index = r.result_code
+            result_counts[index] += 1
+
+            conversation = r.conversation_group or "unknown"
+            counts = conversation_counts.get(conversation)
+            if counts is None:
+                counts = conversation_counts[conversation] = [0, 0, 0]
+            counts[index] += 1
+
+            counts = eval_type_counts.get(r.eval_type)
+            if counts is None:
+                counts = eval_type_counts[r.eval_type] = [0, 0, 0]
+            counts[index] += 1
+
+        passed, failed, errored = result_counts
         success_rate = (passed / total * 100) if total > 0 else 0.0
 
-        # Count unique conversations
-        conversations: set[str] = set(
-            r.conversation_group for r in results if r.conversation_group
-        )
-
-        # Calculate statistics by conversation
-        by_conversation = _calculate_stats_by_category(
-            results, lambda r: r.conversation_group or "unknown"
-        )
-
-        # Calculate statistics by eval_type
-        by_eval_type = _calculate_stats_by_category(results, lambda r: r.eval_type)
-
         return cls(
             total_evaluations=total,
-            total_conversations=len(conversations),
+            # Results without conversation group are counted under "unknown"
+            total_conversations=len(conversation_counts)
+            - ("unknown" in conversation_counts),
             passed=passed,
             failed=failed,
             errored=errored,
             success_rate=success_rate,
-            by_conversation=by_conversation,
-            by_eval_type=by_eval_type,
+            by_conversation=_build_category_stats(conversation_counts),
+            by_eval_type=_build_category_stats(eval_type_counts),
         )
@@ -1,17 +1,95 @@
 """Results management for agent evaluation."""
 
+import csv
 import json
 import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-
-import pandas as pd
+from typing import Any, TextIO
 
 from ..utils.exceptions import AgentEvaluationError
 from .models import EvaluationResult, EvaluationStats
 
 logger = logging.getLogger(__name__)
 
+CSV_COLUMNS = [
+    "conversation_group",
+    "conversation_id",
+    "eval_id",
+    "query",
+    "response",
+    "eval_type",
+    "result",
+    "error",
+    "tool_calls",
+    "expected_intent",
+]
+
+
+def _get_output_files(result_dir: str) -> tuple[Path, Path]:
+    """Create result directory and get timestamped CSV/JSON output files."""
+    output_dir = Path(result_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    csv_file = output_dir / f"agent_goal_eval_results_{timestamp}.csv"
+    json_file = output_dir / f"agent_goal_eval_summary_{timestamp}.json"
+    return csv_file, json_file
+
+
+def _get_csv_row(result: EvaluationResult) -> dict[str, Any]:
+    """Get CSV row for an evaluation result."""
+    return {
+        "conversation_group": result.conversation_group,
+        "conversation_id": result.conversation_id,
+        "eval_id": result.eval_id,
+        "query": result.query,
+        "response": result.response,
+        "eval_type": result.eval_type,
+        "result": result.result,
+        "error": result.error,
+        "tool_calls": result.tool_calls,
+        "expected_intent": result.expected_intent,
+    }
+
+
+class ResultsStream:
+    """Writes evaluation results to CSV as they are produced.
+
+    Rows are flushed to disk as soon as they are written, so results completed
+    before a crash or interruption are kept.
+    """
+
+    def __init__(self, csv_fh: TextIO, csv_file: Path, json_file: Path):
+        """Initialize results stream and write CSV header."""
+        self.csv_file = csv_file
+        self.json_file = json_file
+        self._csv_fh = csv_fh
+        self._writer = csv.DictWriter(csv_fh, fieldnames=CSV_COLUMNS)
+        self._row_count = 0
+        # Conversations may be evaluated concurrently
+        self._lock = threading.Lock()
+
+        self._writer.writeheader()
+        self._csv_fh.flush()
+
+    @property
+    def row_count(self) -> int:
+        """Number of results written so far."""
+        return self._row_count
+
+    def extend(self, results: list[EvaluationResult]) -> None:
+        """Write multiple results to CSV and persist them to disk."""
+        with self._lock:
+            self._writer.writerows(_get_csv_row(result) for result in results)
+            self._row_count += len(results)
+            self._csv_fh.flush()
+            os.fsync(self._csv_fh.fileno())
+
 
 class ResultsManager:
     """Manages evaluation results and output."""
@@ -22,52 +100,47 @@ class ResultsManager:
 
         self.results_stats = EvaluationStats.from_results(results)
 
-    def save_results(self, result_dir: str) -> None:
-        """Save evaluation results/statistics to CSV and JSON files."""
+    @staticmethod
+    @contextmanager
+    def open_stream(result_dir: str) -> Iterator[ResultsStream]:
+        """Open timestamped CSV results file for incremental writes.
+
+        The CSV file is removed again if no result was written, matching
+        save_summary, which writes no JSON file without results.
+        """
+        results_stream = None
+        try:
+            with ExitStack() as stack:
+                try:
+                    csv_file, json_file = _get_output_files(result_dir)
+                    csv_fh = stack.enter_context(
+                        open(csv_file, "w", newline="", encoding="utf-8")
+                    )
+                except OSError as e:
+                    logger.error("Failed to open results file: %s", e)
+                    raise AgentEvaluationError(
+                        f"Failed to open results file: {e}"
+                    ) from e
+
+                results_stream = ResultsStream(csv_fh, csv_file, json_file)
+                yield results_stream
+                if results_stream.row_count:
+                    logger.info("Results saved to %s", csv_file)
+        finally:
+            if results_stream is not None and not results_stream.row_count:
+                results_stream.csv_file.unlink(missing_ok=True)
+
+    def save_summary(self, json_file: Path) -> None:
+        """Save evaluation statistics to JSON file, results already streamed."""
         if not self.results:
             logger.warning("No result to save")
             return
 
         try:
-            output_dir = Path(result_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-            csv_file = output_dir / f"agent_goal_eval_results_{timestamp}.csv"
-            json_file = output_dir / f"agent_goal_eval_summary_{timestamp}.json"
-
-            # Save CSV results
-            self._save_csv_results(csv_file)
-            # Save summary JSON
             self._save_json_summary(json_file)
-
         except Exception as e:
-            logger.error("Failed to save results: %s", e)
-            raise AgentEvaluationError(f"Failed to save results: {e}") from e
-
-    def _save_csv_results(self, file_path: Path) -> None:
-        """Save results to CSV file."""
-        data = []
-        for result in self.results:
-            data.append(
-                {
-                    "conversation_group": result.conversation_group,
-                    "conversation_id": result.conversation_id,
-                    "eval_id": result.eval_id,
-                    "query": result.query,
-                    "response": result.response,
-                    "eval_type": result.eval_type,
-                    "result": result.result,
-                    "error": result.error,
-                    "tool_calls": result.tool_calls,
-                    "expected_intent": result.expected_intent,
-                }
-            )
-
-        df = pd.DataFrame(data)
-
-        df.to_csv(file_path, index=False, encoding="utf-8")
-        logger.info("Results saved to %s", file_path)
+            logger.error("Failed to save summary: %s", e)
+            raise AgentEvaluationError(f"Failed to save summary: {e}") from e
 
     def _save_json_summary(self, file_path: Path) -> None:
         """Save eval summary to JSON file."""
@@ -80,8 +153,9 @@ class ResultsManager:
                 "errored": self.results_stats.errored,
                 "success_rate": round(self.results_stats.success_rate, 2),
             },
-            "by_conversation": self.results_stats.by_conversation,
-            "by_eval_type": self.results_stats.by_eval_type,
+            **self.results_stats.model_dump(
+                include={"by_conversation", "by_eval_type"}
+            ),
         }
 
         with open(file_path, "w", encoding="utf-8") as f:
@@ -17,19 +17,24 @@ class ScriptRunner:
     def __init__(self, kubeconfig: Optional[str] = None):
         """Initialize script runner."""
         self.kubeconfig = kubeconfig
+        # Same scripts run for many evaluations, check/prepare each only once
+        self._environment: Optional[dict] = None
+        self._prepared_scripts: set[Path] = set()
+        self._resolved_scripts: dict[Union[str, Path], Path] = {}
 
     def get_environment(self) -> dict:
         """Get environment variables for script execution."""
-        env = os.environ.copy()
-        if self.kubeconfig:
-            env["KUBECONFIG"] = self.kubeconfig
-        return env
-
-    def run_script(self, script_path: Union[str, Path]) -> bool:
-        """Execute a script and return success status."""
-        if isinstance(script_path, str):
-            script_path = Path(script_path)
-        script_path = script_path.resolve()
+        if self._environment is None:
+            env = os.environ.copy()
+            if self.kubeconfig:
+                env["KUBECONFIG"] = self.kubeconfig
+            self._environment = env
+        return self._environment
+
+    def _prepare_script(self, script_path: Path) -> None:
+        """Validate script and make it executable, once per script path."""
+        if script_path in self._prepared_scripts:
+            return
 
         if not script_path.exists():
             raise ScriptExecutionError(f"Script not found: {script_path}")
@@ -38,12 +43,34 @@ class ScriptRunner:
             raise ScriptExecutionError(f"Script path is not a file: {script_path}")
 
         try:
-            # Setup environment
-            env = self.get_environment()
-
             # Make script executable if it is not executable
-            if not os.access(str(script_path.resolve()), os.X_OK):
+            if not os.access(str(script_path), os.X_OK):
                 script_path.chmod(0o755)
+        except OSError as e:
+            raise ScriptExecutionError(
+                f"Unexpected error running script {script_path}: {e}"
+            ) from e
+
+        self._prepared_scripts.add(script_path)
+
+    def _resolve_script(self, script_path: Union[str, Path]) -> Path:
+        """Resolve script path, caching absolute paths across runs."""
+        resolved = self._resolved_scripts.get(script_path)
+        if resolved is None:
+            resolved = Path(script_path).resolve()
+            # Relative paths depend on the current directory, resolve them each time
+            if os.path.isabs(script_path):
+                self._resolved_scripts[script_path] = resolved
+        return resolved
+
+    def run_script(self, script_path: Union[str, Path]) -> bool:
+        """Execute a script and return success status."""
+        script_path = self._resolve_script(script_path)
+        self._prepare_script(script_path)
+
+        try:
+            # Setup environment
+            env = self.get_environment()
 
             # Run script
             logger.debug("Running script: %s", script_path)
@@ -21,14 +21,19 @@ def create_evaluation_results(  # pylint: disable=too-many-arguments,too-many-po
     conversation_id: Optional[str] = None,
     tool_calls: Optional[list[list[dict]]] = None,
 ) -> list[EvaluationResult]:
-    """Create standardized evaluation results."""
+    """Create standardized evaluation results.
+
+    Results are built with model_construct, skipping field validation: all
+    values come from an already validated eval config and from the evaluator
+    (result is always one of PASS/FAIL/ERROR).
+    """
     results = []
 
     if error_message:
         # Global error - create ERROR results for all eval types
         for eval_type in eval_config.eval_types:
             results.append(
-                EvaluationResult(
+                EvaluationResult.model_construct(
                     eval_id=eval_config.eval_id,
                     query=eval_config.eval_query,
                     response=response,
@@ -49,7 +54,7 @@ def create_evaluation_results(  # pylint: disable=too-many-arguments,too-many-po
         # Individual evaluation results
         for eval_result in evaluation_results:
             results.append(
-                EvaluationResult(
+                EvaluationResult.model_construct(
                     eval_id=eval_config.eval_id,
                     query=eval_config.eval_query,
                     response=response,
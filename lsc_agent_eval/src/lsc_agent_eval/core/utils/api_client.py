@@ -1,5 +1,6 @@
 """HTTP client for agent API communication."""
 
+import importlib.util
 import json
 import logging
 import os
@@ -8,10 +9,19 @@ from typing import Any, Optional
 import httpx
 
 from .exceptions import AgentAPIError
+from .json_loader import json_loads
 from .streaming_parser import parse_streaming_response
 
 logger = logging.getLogger(__name__)
 
+# All requests go to the same agent host, keep connections alive for reuse
+CLIENT_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=64, keepalive_expiry=60.0
+)
+CONNECT_TIMEOUT = 10.0
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
 
 class AgentHttpClient:
     """HTTP client for agent API communication."""
@@ -35,6 +45,7 @@ class AgentHttpClient:
         """
         self.endpoint = endpoint
         self.version = version
+        self.timeout = timeout
         self.client: Optional[httpx.Client] = None
         self._setup_client(token_file, verify_ssl, timeout)
 
@@ -44,7 +55,11 @@ class AgentHttpClient:
         """Initialize HTTP client with authentication."""
         try:
             self.client = httpx.Client(
-                base_url=self.endpoint, verify=verify_ssl, timeout=timeout
+                base_url=self.endpoint,
+                verify=verify_ssl,
+                timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT),
+                limits=CLIENT_LIMITS,
+                http2=HTTP2_ENABLED,
             )
 
             token = None
@@ -67,9 +82,7 @@ class AgentHttpClient:
         except Exception as e:
             raise AgentAPIError(f"Error reading token file: {e}") from e
 
-    def query_agent(
-        self, api_input: dict[str, str], timeout: int = 300
-    ) -> dict[str, Any]:
+    def query_agent(self, api_input: dict[str, str]) -> dict[str, Any]:
         """Query the agent using non-streaming endpoint."""
         if not self.client:
             raise AgentAPIError("HTTP client not initialized")
@@ -78,15 +91,15 @@ class AgentHttpClient:
             response = self.client.post(
                 f"/{self.version}/query",
                 json=api_input,
-                timeout=timeout,
             )
             response.raise_for_status()
 
-            response_data = response.json()
-            if "response" not in response_data:
+            response_data = json_loads(response.content)
+            agent_response = response_data.get("response")
+            if agent_response is None:
                 raise AgentAPIError("Agent response missing 'response' field")
 
-            agent_response = response_data["response"].strip()
+            agent_response = agent_response.strip()
             conversation_id = response_data.get("conversation_id", "").strip()
             tool_calls = response_data.get("tool_calls", [])
 
@@ -100,7 +113,9 @@ class AgentHttpClient:
             }
 
         except httpx.TimeoutException as e:
-            raise AgentAPIError(f"Agent query timeout after {timeout} seconds") from e
+            raise AgentAPIError(
+                f"Agent query timeout after {self.timeout} seconds"
+            ) from e
         except httpx.HTTPStatusError as e:
             raise AgentAPIError(
                 f"Agent API error: {e.response.status_code} - {e.response.text}"
@@ -126,9 +141,7 @@ class AgentHttpClient:
 
         return formatted_sequences
 
-    def streaming_query_agent(
-        self, api_input: dict[str, str], timeout: int = 300
-    ) -> dict[str, Any]:
+    def streaming_query_agent(self, api_input: dict[str, str]) -> dict[str, Any]:
         """Query the agent using streaming endpoint."""
         if not self.client:
             raise AgentAPIError("HTTP client not initialized")
@@ -138,7 +151,6 @@ class AgentHttpClient:
                 "POST",
                 f"/{self.version}/streaming_query",
                 json=api_input,
-                timeout=timeout,
             ) as response:
                 # Potential change lsc-stack to provide SSE error message
                 if response.status_code != 200:
@@ -172,7 +184,7 @@ class AgentHttpClient:
 
         except httpx.TimeoutException as e:
             raise AgentAPIError(
-                f"Agent streaming query timeout after {timeout} seconds"
+                f"Agent streaming query timeout after {self.timeout} seconds"
             ) from e
         except httpx.HTTPStatusError as e:
             raise AgentAPIError(str(e)) from e
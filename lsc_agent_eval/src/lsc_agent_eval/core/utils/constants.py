@@ -5,4 +5,11 @@ DEFAULT_RESULT_DIR = "eval_output/"
 
 # Retry configuration
 MAX_RETRY_ATTEMPTS = 3
-TIME_TO_BREATH = 2  # seconds between retries
+TIME_TO_BREATH = 2  # base seconds between retries, doubled on every attempt
+MAX_RETRY_DELAY = 30  # seconds
+
+# Judge model request timeout
+JUDGE_TIMEOUT = 300  # seconds
+
+# Only valid judge model verdicts (judge prompts ask for a bare 0 or 1)
+JUDGE_VERDICTS = frozenset({"0", "1"})
@@ -0,0 +1,18 @@
+"""JSON parsing for agent API responses."""
+
+import importlib
+import json
+from typing import Any, Callable, Union
+
+# orjson is much faster on large agent responses, stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the stdlib error.
+try:
+    _loads: Callable[[Union[str, bytes]], Any] = importlib.import_module("orjson").loads
+except ImportError:
+    _loads = json.loads
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON document from str or UTF-8 bytes."""
+    return _loads(data)
@@ -2,25 +2,89 @@
 
 import logging
 import os
+import random
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from typing import Optional
+from typing import Any, Optional
 
 import litellm  # pylint: disable=import-error  # type: ignore[import-untyped]
+from litellm.exceptions import (  # pylint: disable=import-error  # type: ignore[import-untyped]
+    APIConnectionError,
+    InternalServerError,
+    RateLimitError,
+    ServiceUnavailableError,
+)
 
-from .constants import MAX_RETRY_ATTEMPTS, TIME_TO_BREATH
+from .constants import (
+    JUDGE_TIMEOUT,
+    JUDGE_VERDICTS,
+    MAX_RETRY_ATTEMPTS,
+    MAX_RETRY_DELAY,
+    TIME_TO_BREATH,
+)
 from .exceptions import JudgeModelError
+from .judge_cache import JudgeCache
 
 logger = logging.getLogger(__name__)
 
+# Transient judge errors, retried with backoff (APIConnectionError covers timeouts)
+RETRYABLE_ERRORS = (
+    TimeoutError,
+    APIConnectionError,
+    RateLimitError,
+    InternalServerError,
+    ServiceUnavailableError,
+)
+
+
+def _get_retry_delay(error: Exception, retry_counter: int) -> float:
+    """Get delay before next retry, honoring Retry-After when provided.
+
+    Args:
+        error: Error raised by the failed attempt.
+        retry_counter: Zero-based index of the failed attempt.
+
+    Returns:
+        Seconds to wait, exponential backoff with jitter capped at MAX_RETRY_DELAY.
+    """
+    response = getattr(error, "response", None)
+    retry_after = getattr(response, "headers", {}).get("retry-after")
+    if retry_after:
+        try:
+            return min(MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+
+    delay = min(MAX_RETRY_DELAY, TIME_TO_BREATH * (2**retry_counter))
+    # Jitter spreads out retries of concurrent evaluations
+    return delay * (0.5 + random.random() / 2)
+
 
 # TODO(future): Move to llama-stack
 class JudgeModelManager:
     """Manages judge model loading and evaluation using llm."""
 
-    def __init__(self, judge_provider: str, judge_model: str):
-        """Initialize judge model manager."""
+    def __init__(
+        self,
+        judge_provider: str,
+        judge_model: str,
+        cache_dir: Optional[str] = None,
+        constrain_output: bool = False,
+    ):
+        """Initialize judge model manager.
+
+        Args:
+            judge_provider: Judge model provider (e.g., openai, azure, watsonx).
+            judge_model: Judge model name.
+            cache_dir: Optional directory for caching judge responses on disk.
+                Caching is disabled when not set.
+            constrain_output: Restrict judge output to a single 0/1 token using
+                logit_bias (OpenAI/Azure only, not for reasoning models).
+        """
         self.judge_provider = judge_provider
         self.judge_model = judge_model
+        self.constrain_output = constrain_output
+        self.cache = JudgeCache(cache_dir) if cache_dir else None
         try:
             self._setup_litellm()
         except Exception as e:
@@ -33,6 +97,8 @@ class JudgeModelManager:
         )
 
         provider = self.judge_provider.lower()
+        # Provider credentials, resolved once and passed on every completion call
+        credentials: dict[str, Any] = {}
 
         if provider == "openai":
             api_key = os.environ.get("OPENAI_API_KEY")
@@ -40,6 +106,7 @@ class JudgeModelManager:
                 raise JudgeModelError(
                     "OPENAI_API_KEY environment variable is required for OpenAI provider"
                 )
+            credentials = {"api_key": api_key}
             self.model_name = self.judge_model
 
         elif provider == "azure":
@@ -57,6 +124,7 @@ class JudgeModelManager:
 
             # Use deployment name if provided, otherwise use model name
             deployment = deployment_name or self.judge_model
+            credentials = {"api_key": api_key, "api_base": api_base}
             self.model_name = f"azure/{deployment}"
 
         elif provider == "watsonx":
@@ -72,6 +140,11 @@ class JudgeModelManager:
                     "required for Watsonx provider"
                 )
 
+            credentials = {
+                "api_key": api_key,
+                "api_base": api_base,
+                "project_id": project_id,
+            }
             self.model_name = f"watsonx/{self.judge_model}"
 
         elif provider == "vertex":
@@ -87,19 +160,69 @@ class JudgeModelManager:
             logger.warning("Using generic provider format for %s", provider)
             self.model_name = f"{provider}/{self.judge_model}"
 
+        # Call parameters are the same for every judge request; all but the
+        # credentials also key the response cache
+        self._request_params: dict[str, Any] = {
+            "model": self.model_name,
+            "temperature": 0.0,
+            "timeout": JUDGE_TIMEOUT,
+        }
+        if self.constrain_output:
+            self._request_params.update(self._get_verdict_constraints(provider))
+        self._completion_kwargs = {**self._request_params, **credentials}
+
         # LiteLLM configuration - verbose logging is disabled by default
+        litellm.suppress_debug_info = True
+
+    def _get_verdict_constraints(self, provider: str) -> dict[str, Any]:
+        """Get completion kwargs limiting judge output to one verdict token."""
+        if provider not in ("openai", "azure"):
+            logger.warning(
+                "Constrained judge output is not supported for %s provider, ignoring",
+                provider,
+            )
+            return {}
+
+        logit_bias = {}
+        for verdict in sorted(JUDGE_VERDICTS):
+            token_ids = litellm.encode(model=self.judge_model, text=verdict)
+            if len(token_ids) != 1:
+                raise JudgeModelError(
+                    f"Judge verdict '{verdict}' is not a single token "
+                    f"for model {self.judge_model}"
+                )
+            logit_bias[str(token_ids[0])] = 100
+
+        return {"logit_bias": logit_bias, "max_tokens": 1}
+
+    def evaluate_response(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> Optional[str]:
+        """Evaluate response using judge model via LiteLLM.
+
+        Args:
+            prompt: User prompt with the values to evaluate.
+            system_prompt: Optional static instructions, sent as a separate system
+                message so that providers can reuse the cached prompt prefix.
+
+        Returns:
+            Stripped judge model response content.
+        """
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
+        if self.cache:
+            cached_response = self.cache.get(self._request_params, messages)
+            if cached_response is not None:
+                logger.debug("Judge response served from cache")
+                return cached_response
 
-    def evaluate_response(self, prompt: str) -> Optional[str]:
-        """Evaluate response using judge model via LiteLLM."""
         for retry_counter in range(MAX_RETRY_ATTEMPTS):
             try:
                 # Use LiteLLM completion
                 response = litellm.completion(
-                    model=self.model_name,
-                    # use system prompt
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.0,
-                    timeout=300,
+                    messages=messages, **self._completion_kwargs
                 )
                 content = None
                 # Try to access response content through different possible structures
@@ -114,13 +237,16 @@ class JudgeModelManager:
                         content = getattr(message, "content", None)
 
                 if content:
-                    return content.strip()
+                    content = content.strip()
+                    if self.cache:
+                        self.cache.set(self._request_params, messages, content)
+                    return content
 
                 raise JudgeModelError(
                     f"No valid response from Judge Model. Check full response\n{str(response)}"
                 )
 
-            except TimeoutError as e:
+            except RETRYABLE_ERRORS as e:
                 if retry_counter == MAX_RETRY_ATTEMPTS - 1:
                     raise JudgeModelError(
                         f"Judge model evaluation failed after "
@@ -130,10 +256,69 @@ class JudgeModelManager:
                 logger.warning(
                     "Judge model attempt %d failed: %s", retry_counter + 1, e
                 )
-                sleep(TIME_TO_BREATH)
+                sleep(_get_retry_delay(e, retry_counter))
 
         return None
 
     def get_model_name(self) -> str:
         """Get the configured model name."""
         return self.model_name
+
+
+def parse_judge_spec(judge_spec: str) -> tuple[str, str]:
+    """Parse judge specification in 'provider:model' format.
+
+    Args:
+        judge_spec: Judge specification, e.g. "openai:gpt-4o-mini".
+
+    Returns:
+        Tuple of judge provider and judge model.
+
+    Raises:
+        JudgeModelError: If the specification is not in 'provider:model' format.
+    """
+    provider, _, model = judge_spec.partition(":")
+    provider, model = provider.strip(), model.strip()
+    if not provider or not model:
+        raise JudgeModelError(
+            f"Invalid judge '{judge_spec}', expected format is 'provider:model'"
+        )
+    return provider, model
+
+
+class JudgeEnsemble:
+    """Multiple judge models voting on the same evaluation."""
+
+    def __init__(self, judges: list[JudgeModelManager]):
+        """Initialize judge ensemble.
+
+        Args:
+            judges: Judge model managers, all queried for every evaluation.
+        """
+        if not judges:
+            raise JudgeModelError("Judge ensemble requires at least one judge model")
+        self.judges = judges
+
+    def evaluate_responses(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> list[Optional[str]]:
+        """Evaluate response with all judge models concurrently.
+
+        Args:
+            prompt: User prompt with the values to evaluate.
+            system_prompt: Optional static instructions for the judge models.
+
+        Returns:
+            Judge model responses, in the same order as the judges.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.judges)) as executor:
+            return list(
+                executor.map(
+                    lambda judge: judge.evaluate_response(prompt, system_prompt),
+                    self.judges,
+                )
+            )
+
+    def get_model_names(self) -> list[str]:
+        """Get the configured model names."""
+        return [judge.get_model_name() for judge in self.judges]
@@ -0,0 +1,84 @@
+"""On-disk cache for judge model responses."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JudgeCache:
+    """Content-addressed judge response cache keyed by (request params, messages).
+
+    Request params are the completion kwargs other than credentials (model,
+    temperature, output constraints, ...), so a change to any of them is a miss.
+
+    Entries are stored as one JSON file per key, so reruns of identical
+    evaluations are served from disk. An in-memory layer de-duplicates
+    identical requests within a single run.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        """Initialize judge cache, creating the cache directory if needed."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(params: dict[str, Any], messages: list[dict[str, str]]) -> str:
+        """Build cache key from request params and chat messages."""
+        payload = json.dumps([params, messages], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self, params: dict[str, Any], messages: list[dict[str, str]]
+    ) -> Optional[str]:
+        """Get cached judge response, or None when not cached."""
+        key = self._make_key(params, messages)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+
+        entry_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                response = json.load(f).get("response")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring invalid judge cache entry %s: %s", entry_path, e)
+            return None
+
+        if not isinstance(response, str):
+            return None
+
+        with self._lock:
+            self._memory[key] = response
+        return response
+
+    def set(
+        self, params: dict[str, Any], messages: list[dict[str, str]], response: str
+    ) -> None:
+        """Store judge response; write failures are logged and ignored."""
+        key = self._make_key(params, messages)
+        with self._lock:
+            self._memory[key] = response
+
+        entry_path = self.cache_dir / f"{key}.json"
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"model": params.get("model"), "response": response}, f)
+            # Atomic rename, so concurrent readers never see a partial entry
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning("Failed to write judge cache entry %s: %s", entry_path, e)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
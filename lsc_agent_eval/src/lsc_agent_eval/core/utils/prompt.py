@@ -1,14 +1,16 @@
-"""Prompt for Judge LLM."""
+"""Prompt for Judge LLM.
+
+Each prompt is split into a static system prompt (instructions) and a user prompt
+template (per-evaluation values), so that providers supporting prompt caching can
+reuse the identical instruction prefix across evaluations.
+"""
 
 # Basic Prompt to check correctness (returns 1 or 0)
-ANSWER_CORRECTNESS_PROMPT = """You are an expert evaluator. \
+ANSWER_CORRECTNESS_SYSTEM_PROMPT = """You are an expert evaluator. \
 Your task is to evaluate whether a response correctly answers \
 a question based on the expected answer.
 
-Question: {question}
-Expected Answer: {answer}
-Actual Response: {response}
-
+You will be given a question, the expected answer and the actual response.
 Please evaluate if the actual response is correct based on the expected answer.
 Consider:
 1. Does the response answer the question correctly?
@@ -18,14 +20,15 @@ Consider:
 Return only 1 if the response is correct, or 0 if it is incorrect.
 Do not add any other text apart from 0 or 1 in your response."""
 
+ANSWER_CORRECTNESS_USER_PROMPT = """Question: {question}
+Expected Answer: {answer}
+Actual Response: {response}"""
+
 # Intent Detection Prompt to check if response has the expected intent (returns 1 or 0)
-INTENT_DETECTION_PROMPT = """You are an expert evaluator. \
+INTENT_DETECTION_SYSTEM_PROMPT = """You are an expert evaluator. \
 Your task is to evaluate whether a response demonstrates the expected intent or purpose.
 
-Question: {question}
-Expected Intent of Response: {intent}
-Actual Response: {response}
-
+You will be given a question, the expected intent of the response and the actual response.
 Please evaluate if the actual response has the expected intent.
 Consider:
 1. What is the intent/purpose of the actual response?
@@ -40,3 +43,7 @@ For example:
 
 Return only 1 if the response has the expected intent, or 0 if it does not.
 Do not add any other text apart from 0 or 1 in your response."""
+
+INTENT_DETECTION_USER_PROMPT = """Question: {question}
+Expected Intent of Response: {intent}
+Actual Response: {response}"""
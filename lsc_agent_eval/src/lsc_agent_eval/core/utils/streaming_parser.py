@@ -6,6 +6,8 @@ from typing import Any, Optional, Tuple
 
 import httpx
 
+from .json_loader import json_loads
+
 logger = logging.getLogger(__name__)
 
 DATA_PREFIX = "data: "
@@ -63,7 +65,7 @@ def parse_streaming_response(response: httpx.Response) -> dict[str, Any]:
 def _parse_streaming_line(json_data: str) -> Optional[Tuple[str, dict]]:
     """Parse a single streaming line and return event and data."""
     try:
-        data = json.loads(json_data)
+        data = json_loads(json_data)
         event = data.get("event", "")
         event_data = data.get("data", {})
         return event, event_data
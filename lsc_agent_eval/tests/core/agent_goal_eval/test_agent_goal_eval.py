@@ -29,8 +29,12 @@ class TestAgentGoalEval:
         args.agent_model = "gpt-4"
         args.judge_provider = "openai"
         args.judge_model = "gpt-4"
+        args.judge_cache_dir = None
+        args.additional_judges = None
+        args.judge_constrained_output = False
         args.kubeconfig = None
         args.result_dir = "results/"
+        args.max_inflight = 1
         return args
 
     @pytest.fixture
@@ -107,7 +111,9 @@ class TestAgentGoalEval:
         mock_agent_client.assert_called_once_with(
             "http://localhost:8080", version="v1", token_file=None
         )
-        mock_judge_manager.assert_called_once_with("openai", "gpt-4")
+        mock_judge_manager.assert_called_once_with(
+            "openai", "gpt-4", cache_dir=None, constrain_output=False
+        )
         mock_script_runner.assert_called_once_with(None)
         mock_evaluation_runner.assert_called_once_with(
             mock_agent_client.return_value,
@@ -115,6 +121,42 @@ class TestAgentGoalEval:
             mock_judge_manager.return_value,
         )
 
+    def test_init_with_additional_judges(
+        self,
+        mocker: MockerFixture,
+        mock_args,
+    ):
+        """Test initialization with additional judges builds a judge ensemble."""
+        mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.AgentGoalEvalDataManager"
+        )
+        mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.AgentHttpClient"
+        )
+        mock_judge_manager = mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.JudgeModelManager"
+        )
+        mock_judge_ensemble = mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.JudgeEnsemble"
+        )
+        mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.EvaluationRunner"
+        )
+        mocker.patch("lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.ScriptRunner")
+
+        mock_args.additional_judges = ["azure:gpt-4o", "watsonx:granite"]
+        evaluator = AgentGoalEval(mock_args)
+
+        assert mock_judge_manager.call_args_list == [
+            mocker.call("openai", "gpt-4", cache_dir=None, constrain_output=False),
+            mocker.call("azure", "gpt-4o", cache_dir=None, constrain_output=False),
+            mocker.call("watsonx", "granite", cache_dir=None, constrain_output=False),
+        ]
+        mock_judge_ensemble.assert_called_once_with(
+            [mock_judge_manager.return_value] * 3
+        )
+        assert evaluator.judge_manager == mock_judge_ensemble.return_value
+
     def test_init_without_judge_manager(
         self,
         mocker: MockerFixture,
@@ -230,14 +272,78 @@ class TestAgentGoalEval:
         # Verify evaluations were run
         assert mock_evaluation_runner.return_value.run_evaluation.call_count == 2
 
-        # Verify results were saved
-        mock_results_mgr_instance.save_results.assert_called_once_with(
-            mock_args.result_dir
+        # Verify results were streamed and summary was saved
+        mock_results_manager.open_stream.assert_called_once_with(mock_args.result_dir)
+        mock_stream = (
+            mock_results_manager.open_stream.return_value.__enter__.return_value
+        )
+        assert mock_stream.extend.call_count == 2
+        mock_results_mgr_instance.save_summary.assert_called_once_with(
+            mock_stream.json_file
         )
 
         # Verify summary was printed
         mock_print.assert_called()
 
+    def test_run_evaluation_concurrent_conversations(
+        self,
+        mocker: MockerFixture,
+        mock_args,
+        sample_results,
+    ):
+        """Test conversations run concurrently and keep conversation order."""
+        mock_config_manager = mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.AgentGoalEvalDataManager"
+        )
+        mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.AgentHttpClient"
+        )
+        mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.JudgeModelManager"
+        )
+        mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.EvaluationRunner"
+        )
+        mocker.patch("lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.ScriptRunner")
+        mock_results_manager = mocker.patch(
+            "lsc_agent_eval.core.agent_goal_eval.agent_goal_eval.ResultsManager"
+        )
+
+        conversations = [
+            ConversationDataConfig(
+                conversation_group=f"conv_{idx}",
+                conversation=[
+                    EvaluationDataConfig(
+                        eval_id="test_001",
+                        eval_query="Deploy nginx",
+                        eval_types=["response_eval:sub-string"],
+                        expected_keywords=["nginx"],
+                    )
+                ],
+            )
+            for idx in range(2)
+        ]
+        mock_config_manager.return_value.get_conversations.return_value = conversations
+        mock_results_manager.return_value.get_results_stats.return_value = (
+            EvaluationStats.from_results(sample_results)
+        )
+
+        mock_args.max_inflight = 2
+        evaluator = AgentGoalEval(mock_args)
+        mock_process = mocker.patch.object(
+            evaluator,
+            "_process_conversation",
+            side_effect=lambda conv, results_stream: [
+                f"{conv.conversation_group}_result"
+            ],
+        )
+
+        mocker.patch("builtins.print")
+        evaluator.run_evaluation()
+
+        assert mock_process.call_count == 2
+        mock_results_manager.assert_called_once_with(["conv_0_result", "conv_1_result"])
+
     def test_get_result_summary_success(self, mocker: MockerFixture, mock_args):
         """Test result summary with available results."""
         mocker.patch(
@@ -360,6 +360,41 @@ class TestAgentGoalEvalDataManager:
         with pytest.raises(EvaluationDataError, match="Duplicate conversation_group"):
             AgentGoalEvalDataManager("test.yaml")
 
+    def test_validation_error_reports_conversation(self, mocker: MockerFixture):
+        """Test validation error names the invalid conversation and field."""
+        invalid_data = [
+            {
+                "conversation_group": "valid_group",
+                "conversation": [
+                    {
+                        "eval_id": "test1",
+                        "eval_query": "test query 1",
+                        "eval_types": ["response_eval:accuracy"],
+                        "expected_response": "test response 1",
+                    }
+                ],
+            },
+            {
+                "conversation_group": "invalid_group",
+                "conversation": [
+                    {
+                        "eval_id": "test2",
+                        "eval_types": ["response_eval:accuracy"],
+                        "expected_response": "test response 2",
+                    }
+                ],
+            },
+        ]
+        yaml_content = yaml.dump(invalid_data)
+        mocker.patch("builtins.open", mocker.mock_open(read_data=yaml_content))
+
+        with pytest.raises(
+            EvaluationDataError,
+            match="Validation error in conversation 'invalid_group': "
+            "conversation -> 0 -> eval_query: Field required",
+        ):
+            AgentGoalEvalDataManager("test.yaml")
+
     def test_get_conversations(
         self, mocker: MockerFixture, valid_conversation_yaml_content
     ):
@@ -1,7 +1,6 @@
 """Tests for agent evaluation data models."""
 
 from pathlib import Path
-from pytest_mock import MockerFixture
 
 import pytest
 from pydantic import ValidationError
@@ -11,6 +10,7 @@ from lsc_agent_eval.core.agent_goal_eval.models import (
     EvaluationDataConfig,
     EvaluationResult,
     EvaluationStats,
+    ResultCode,
 )
 
 
@@ -65,6 +65,32 @@ class TestEvaluationResult:
 
         assert result.error is None
 
+    def test_evaluation_result_code(self):
+        """Test EvaluationResult integer result code."""
+        result = EvaluationResult(
+            eval_id="test_003",
+            query="Test query",
+            response="Test response",
+            eval_type="response_eval:sub-string",
+            result="ERROR",
+        )
+
+        assert result.result_code is ResultCode.ERROR
+        assert "result_code" not in result.model_dump()
+
+    def test_evaluation_result_frozen(self):
+        """Test EvaluationResult is immutable after creation."""
+        result = EvaluationResult(
+            eval_id="test_003",
+            query="Test query",
+            response="Test response",
+            eval_type="response_eval:sub-string",
+            result="PASS",
+        )
+
+        with pytest.raises(ValidationError):
+            result.result = "FAIL"
+
     def test_evaluation_result_invalid_result_type(self):
         """Test EvaluationResult with invalid result type."""
         with pytest.raises(ValidationError) as exc_info:
@@ -161,17 +187,16 @@ class TestEvaluationDataConfig:
         assert config.eval_verify_script is None
         assert config.description is None
 
-    def test_evaluation_data_config_script(self, mocker: MockerFixture):
+    def test_evaluation_data_config_script(self, tmp_path):
         """Test EvaluationDataConfig for script evaluation."""
-        mocker.patch("builtins.open", mocker.mock_open())
-        mock_exists = mocker.patch("pathlib.Path.exists", return_value=True)
-        mock_is_file = mocker.patch("pathlib.Path.is_file", return_value=True)
+        script_file = tmp_path / "verify.sh"
+        script_file.write_text("#!/bin/bash\n")
 
         config = EvaluationDataConfig(
             eval_id="script_test",
             eval_query="Deploy nginx pod",
             eval_types=["action_eval"],
-            eval_verify_script="/mock/script/path.sh",
+            eval_verify_script=str(script_file),
         )
 
         assert config.eval_id == "script_test"
@@ -179,11 +204,19 @@ class TestEvaluationDataConfig:
         assert config.eval_types == ["action_eval"]
         assert config.expected_response is None
         assert config.expected_keywords is None
-        assert isinstance(config.eval_verify_script, Path)
+        assert config.eval_verify_script == script_file
 
-        # Verify path validation was called
-        mock_exists.assert_called()
-        mock_is_file.assert_called()
+    def test_evaluation_data_config_script_not_a_file(self, tmp_path):
+        """Test EvaluationDataConfig with directory as verify script."""
+        with pytest.raises(ValidationError) as exc_info:
+            EvaluationDataConfig(
+                eval_id="script_test",
+                eval_query="Deploy nginx pod",
+                eval_types=["action_eval"],
+                eval_verify_script=str(tmp_path),
+            )
+
+        assert "is not a file" in str(exc_info.value)
 
     def test_evaluation_data_config_substring(self):
         """Test EvaluationDataConfig for sub-string evaluation."""
@@ -201,6 +234,81 @@ class TestEvaluationDataConfig:
         assert config.expected_keywords == ["isolation", "portability", "efficiency"]
         assert config.eval_verify_script is None
 
+    def test_evaluation_data_config_keywords_casefold(self):
+        """Test unique casefolded keywords are derived from expected_keywords."""
+        config = EvaluationDataConfig(
+            eval_id="substring_test",
+            eval_query="List container benefits",
+            eval_types=["response_eval:sub-string"],
+            expected_keywords=["Isolation", " PORTABILITY ", "isolation", "Straße"],
+        )
+
+        assert config.expected_keywords_casefold == (
+            "isolation",
+            "portability",
+            "strasse",
+        )
+        assert "expected_keywords_casefold" not in config.model_dump()
+        assert config.matches_all_keywords("STRASSE isolation portability")
+
+    def test_evaluation_data_config_matches_all_keywords(self):
+        """Test keyword matching ignores case and requires every keyword."""
+        config = EvaluationDataConfig(
+            eval_id="substring_test",
+            eval_query="List container benefits",
+            eval_types=["response_eval:sub-string"],
+            expected_keywords=["Isolation", "portability"],
+        )
+
+        assert config.matches_all_keywords("ISOLATION and Portability")
+        assert not config.matches_all_keywords("isolation only")
+
+    def test_evaluation_data_config_duplicate_eval_types(self):
+        """Test eval types are stripped and de-duplicated in order."""
+        config = EvaluationDataConfig(
+            eval_id="test_001",
+            eval_query="What is Kubernetes?",
+            eval_types=[
+                " response_eval:accuracy",
+                "response_eval:sub-string",
+                "response_eval:accuracy",
+            ],
+            expected_response="Kubernetes is a platform",
+            expected_keywords=["kubernetes"],
+        )
+
+        assert config.eval_types == [
+            "response_eval:accuracy",
+            "response_eval:sub-string",
+        ]
+
+    def test_evaluation_data_config_eval_types_interned(self):
+        """Test validated eval types are interned strings shared across configs."""
+        configs = [
+            EvaluationDataConfig(
+                eval_id=f"test_{idx}",
+                eval_query="What is Kubernetes?",
+                eval_types=["".join(["response_eval:", "accuracy"])],
+                expected_response="Kubernetes is a platform",
+            )
+            for idx in range(2)
+        ]
+
+        assert configs[0].eval_types[0] is configs[1].eval_types[0]
+
+    def test_evaluation_data_config_unknown_field(self):
+        """Test EvaluationDataConfig rejects unknown fields."""
+        with pytest.raises(ValidationError) as exc_info:
+            EvaluationDataConfig(
+                eval_id="test_001",
+                eval_query="What is Kubernetes?",
+                eval_types=["response_eval:accuracy"],
+                expected_response="Kubernetes is a platform",
+                expected_respons="typo",
+            )
+
+        assert "Extra inputs are not permitted" in str(exc_info.value)
+
     def test_evaluation_data_config_with_description(self):
         """Test EvaluationDataConfig with description."""
         config = EvaluationDataConfig(
@@ -219,11 +327,10 @@ class TestEvaluationDataConfig:
         assert config.expected_keywords is None
         assert config.eval_verify_script is None
 
-    def test_evaluation_data_config_multiple_eval_types(self, mocker: MockerFixture):
+    def test_evaluation_data_config_multiple_eval_types(self, tmp_path):
         """Test EvaluationDataConfig with multiple eval types."""
-        mocker.patch("builtins.open", mocker.mock_open())
-        mocker.patch("pathlib.Path.is_file", return_value=True)
-        mocker.patch("pathlib.Path.exists", return_value=True)
+        script_file = tmp_path / "verify.sh"
+        script_file.write_text("#!/bin/bash\n")
 
         config = EvaluationDataConfig(
             eval_id="multi_001",
@@ -233,7 +340,7 @@ class TestEvaluationDataConfig:
                 "response_eval:sub-string",
                 "response_eval:accuracy",
             ],
-            eval_verify_script="/mock/script/path.sh",
+            eval_verify_script=str(script_file),
             expected_keywords=["openshift-lightspeed", "created"],
             expected_response="openshift-lightspeed namespace is successfully created",
             description="Multi-evaluation test",
@@ -408,6 +515,22 @@ class TestEvaluationDataConfig:
 
         assert "file not found" in str(exc_info.value)
 
+    def test_evaluation_data_config_script_inaccessible_file(self, tmp_path):
+        """Test script evaluation with a script path that cannot be accessed."""
+        parent_file = tmp_path / "not_a_dir"
+        parent_file.write_text("", encoding="utf-8")
+
+        with pytest.raises(ValidationError) as exc_info:
+            EvaluationDataConfig(
+                eval_id="test_script",
+                eval_query="Test query",
+                eval_types=["action_eval"],
+                eval_verify_script=str(parent_file / "script.sh"),
+            )
+
+        assert "file cannot be accessed" in str(exc_info.value)
+        assert "Not a directory" in str(exc_info.value)
+
 
 class TestConversationDataConfig:
     """Test Conversation data config."""
@@ -429,21 +552,63 @@ class TestConversationDataConfig:
         assert config.conversation_group == "test_conv"
         assert len(config.conversation) == 1
         assert config.conversation[0].eval_id == "test_001"
+        assert config.conversation[0].conversation_group == "test_conv"
         assert config.description is None
         assert config.setup_script is None
         assert config.cleanup_script is None
 
-    def test_conversation_config_with_scripts(self, mocker: MockerFixture):
+    def test_conversation_config_sets_group_on_raw_evaluations(self):
+        """Test conversation group is set on evaluations parsed from raw data."""
+        config = ConversationDataConfig.model_validate(
+            {
+                "conversation_group": " test_conv ",
+                "conversation": [
+                    {
+                        "eval_id": "test_001",
+                        "eval_query": "What is Kubernetes?",
+                        "eval_types": ["response_eval:accuracy"],
+                        "expected_response": "Kubernetes is a platform",
+                    }
+                ],
+            }
+        )
+
+        assert config.conversation_group == "test_conv"
+        assert config.conversation[0].conversation_group == "test_conv"
+        with pytest.raises(ValidationError):
+            config.conversation[0].conversation_group = "other"
+
+    def test_conversation_config_revalidates_built_evaluations(self):
+        """Test a built evaluation is validated again with each conversation group."""
+        eval_config = EvaluationDataConfig(
+            eval_id="test_001",
+            eval_query="Deploy nginx",
+            eval_types=["response_eval:sub-string"],
+            expected_keywords=[" nginx ", "deployment"],
+        )
+
+        configs = [
+            ConversationDataConfig(conversation_group=group, conversation=[eval_config])
+            for group in ("conv_a", "conv_b")
+        ]
+
+        assert [c.conversation[0].conversation_group for c in configs] == [
+            "conv_a",
+            "conv_b",
+        ]
+        assert configs[0].conversation[0].expected_keywords == ["nginx", "deployment"]
+        assert eval_config.conversation_group is None
+
+    def test_conversation_config_with_scripts(self, tmp_path):
         """Test Conversation data config with setup and cleanup scripts."""
-        mocker.patch("builtins.open", mocker.mock_open())
-        mocker.patch("pathlib.Path.is_file", return_value=True)
-        mocker.patch("pathlib.Path.exists", return_value=True)
+        for script_name in ("setup.sh", "cleanup.sh"):
+            (tmp_path / script_name).write_text("#!/bin/bash\n")
 
         config = ConversationDataConfig(
             conversation_group="test_conv_scripts",
             description="Test conversation with scripts",
-            setup_script="/mock/setup.sh",
-            cleanup_script="/mock/cleanup.sh",
+            setup_script=str(tmp_path / "setup.sh"),
+            cleanup_script=str(tmp_path / "cleanup.sh"),
             conversation=[
                 EvaluationDataConfig(
                     eval_id="test_001",
@@ -456,8 +621,8 @@ class TestConversationDataConfig:
 
         assert config.conversation_group == "test_conv_scripts"
         assert config.description == "Test conversation with scripts"
-        assert isinstance(config.setup_script, Path)
-        assert isinstance(config.cleanup_script, Path)
+        assert config.setup_script == tmp_path / "setup.sh"
+        assert config.cleanup_script == tmp_path / "cleanup.sh"
 
     def test_conversation_config_empty_group_name(self):
         """Test Conversation data config with empty group name."""
@@ -516,6 +681,7 @@ class TestConversationDataConfig:
             )
 
         assert "Duplicate eval_id" in str(exc_info.value)
+        assert "['duplicate_id']" in str(exc_info.value)
 
 
 class TestEvaluationStats:
@@ -562,12 +728,38 @@ class TestEvaluationStats:
         # Check stats by conversation
         assert "conv1" in stats.by_conversation
         assert "conv2" in stats.by_conversation
-        assert stats.by_conversation["conv1"]["total"] == 2
-        assert stats.by_conversation["conv1"]["passed"] == 1
-        assert stats.by_conversation["conv2"]["total"] == 1
-        assert stats.by_conversation["conv2"]["passed"] == 1
+        assert stats.by_conversation["conv1"].total == 2
+        assert stats.by_conversation["conv1"].passed == 1
+        assert stats.by_conversation["conv2"].total == 1
+        assert stats.by_conversation["conv2"].passed == 1
 
         # Check stats by eval_type
         assert "response_eval:accuracy" in stats.by_eval_type
         assert "action_eval" in stats.by_eval_type
         assert "response_eval:sub-string" in stats.by_eval_type
+
+    def test_evaluation_stats_without_conversation_group(self):
+        """Test results without conversation group are not counted as a conversation."""
+        results = [
+            EvaluationResult(
+                eval_id="test_001",
+                query="Query 1",
+                response="Response 1",
+                eval_type="response_eval:accuracy",
+                result="PASS",
+                conversation_group="conv1",
+            ),
+            EvaluationResult(
+                eval_id="test_002",
+                query="Query 2",
+                response="Response 2",
+                eval_type="response_eval:accuracy",
+                result="ERROR",
+            ),
+        ]
+
+        stats = EvaluationStats.from_results(results)
+
+        assert stats.total_conversations == 1
+        assert stats.by_conversation["unknown"].errored == 1
+        assert stats.by_eval_type["response_eval:accuracy"].success_rate == 50.0
@@ -1,11 +1,11 @@
 """Tests for results manager."""
 
+import csv
 import json
 import tempfile
 from pathlib import Path
 from pytest_mock import MockerFixture
 
-import pandas as pd
 import pytest
 
 from lsc_agent_eval.core.agent_goal_eval.models import EvaluationResult, EvaluationStats
@@ -71,44 +71,6 @@ class TestResultsManager:
         assert manager.results == []
         assert manager.results_stats.total_evaluations == 0
 
-    def test_save_results_success(self, mocker: MockerFixture, sample_results):
-        """Test successful results saving."""
-        mock_mkdir = mocker.patch("pathlib.Path.mkdir")
-        mock_to_csv = mocker.patch("pandas.DataFrame.to_csv")
-        mock_file_open = mocker.patch("builtins.open", new_callable=mocker.mock_open)
-
-        manager = ResultsManager(sample_results)
-
-        manager.save_results("test_results/")
-
-        # Verify directory creation
-        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-
-        # Verify CSV saving
-        mock_to_csv.assert_called_once()
-
-        # Verify JSON saving
-        mock_file_open.assert_called()
-
-    def test_save_results_csv_error(self, mocker: MockerFixture, sample_results):
-        """Test results saving with CSV error."""
-        mocker.patch("pathlib.Path.mkdir")
-        mocker.patch("pandas.DataFrame.to_csv", side_effect=Exception("CSV error"))
-
-        manager = ResultsManager(sample_results)
-
-        with pytest.raises(AgentEvaluationError, match="Failed to save results"):
-            manager.save_results("test_results/")
-
-    def test_save_results_mkdir_error(self, mocker: MockerFixture, sample_results):
-        """Test results saving with directory creation error."""
-        mocker.patch("pathlib.Path.mkdir", side_effect=OSError("Permission denied"))
-
-        manager = ResultsManager(sample_results)
-
-        with pytest.raises(AgentEvaluationError, match="Failed to save results"):
-            manager.save_results("test_results/")
-
     def test_csv_data_conversion(self, sample_results):
         """Test CSV data conversion."""
         manager = ResultsManager(sample_results)
@@ -150,8 +112,8 @@ class TestResultsManager:
         # Check conversation breakdown
         assert "conv1" in stats.by_conversation
         assert "conv2" in stats.by_conversation
-        assert stats.by_conversation["conv1"]["total"] == 2
-        assert stats.by_conversation["conv2"]["total"] == 1
+        assert stats.by_conversation["conv1"].total == 2
+        assert stats.by_conversation["conv2"].total == 1
 
         # Check eval type breakdown
         assert "response_eval:accuracy" in stats.by_eval_type
@@ -220,9 +182,9 @@ class TestResultsManager:
         assert stats.total_evaluations == 3
         assert stats.total_conversations == 1
         assert len(stats.by_eval_type) == 3
-        assert stats.by_eval_type["response_eval:accuracy"]["passed"] == 1
-        assert stats.by_eval_type["action_eval"]["failed"] == 1
-        assert stats.by_eval_type["response_eval:sub-string"]["passed"] == 1
+        assert stats.by_eval_type["response_eval:accuracy"].passed == 1
+        assert stats.by_eval_type["action_eval"].failed == 1
+        assert stats.by_eval_type["response_eval:sub-string"].passed == 1
 
     def test_json_statistics_structure(self, sample_results):
         """Test JSON statistics structure."""
@@ -245,31 +207,28 @@ class TestResultsManager:
         assert isinstance(stats_dict["by_conversation"], dict)
         assert isinstance(stats_dict["by_eval_type"], dict)
 
-    def test_filename_generation_format(self, mocker: MockerFixture, sample_results):
+    def test_filename_generation_format(self, mocker: MockerFixture, tmp_path):
         """Test that filename generation follows expected format."""
-        manager = ResultsManager(sample_results)
-
         mock_datetime = mocker.patch(
             "lsc_agent_eval.core.agent_goal_eval.results.datetime"
         )
         mock_datetime.now.return_value.strftime.return_value = "20240101_120000"
 
-        mocker.patch.object(manager, "_save_csv_results")
-        mocker.patch.object(manager, "_save_json_summary")
-        mocker.patch("pathlib.Path.mkdir")
-
-        manager.save_results("test_results/")
+        with ResultsManager.open_stream(str(tmp_path)) as stream:
+            pass
 
         # Verify the filename format is called correctly
         mock_datetime.now.assert_called_once()
         mock_datetime.now.return_value.strftime.assert_called_once_with("%Y%m%d_%H%M%S")
+        assert stream.csv_file.name == "agent_goal_eval_results_20240101_120000.csv"
+        assert stream.json_file.name == "agent_goal_eval_summary_20240101_120000.json"
 
     def test_integration_with_real_files(self, sample_results):
         """Integration test with real temporary files."""
-        manager = ResultsManager(sample_results)
-
         with tempfile.TemporaryDirectory() as temp_dir:
-            manager.save_results(temp_dir)
+            with ResultsManager.open_stream(temp_dir) as stream:
+                stream.extend(sample_results)
+            ResultsManager(sample_results).save_summary(stream.json_file)
 
             # Check that files were created
             result_files = list(Path(temp_dir).glob("agent_goal_eval_results_*.csv"))
@@ -279,11 +238,13 @@ class TestResultsManager:
             assert len(summary_files) == 1
 
             # Verify CSV content
-            csv_data = pd.read_csv(result_files[0])
+            with open(result_files[0], "r", newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                csv_data = list(reader)
             assert len(csv_data) == 3
-            assert "eval_id" in csv_data.columns
-            assert "result" in csv_data.columns
-            assert "conversation_group" in csv_data.columns
+            assert "eval_id" in reader.fieldnames
+            assert "result" in reader.fieldnames
+            assert "conversation_group" in reader.fieldnames
 
             # Verify JSON content
             with open(summary_files[0], "r") as f:
@@ -293,3 +254,71 @@ class TestResultsManager:
             assert json_data["summary"]["passed"] == 2
             assert "by_conversation" in json_data
             assert "by_eval_type" in json_data
+            assert json_data["by_eval_type"]["action_eval"] == {
+                "passed": 0,
+                "failed": 1,
+                "errored": 0,
+                "total": 1,
+                "success_rate": 0.0,
+            }
+
+    def test_open_stream_writes_incrementally(self, tmp_path, sample_results):
+        """Test streamed results are on disk before the stream is closed."""
+        with ResultsManager.open_stream(str(tmp_path)) as stream:
+            assert stream.csv_file.parent == tmp_path
+            assert stream.json_file.name.startswith("agent_goal_eval_summary_")
+
+            stream.extend(sample_results[:1])
+            with open(stream.csv_file, "r", newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            assert len(rows) == 1
+            assert rows[0]["eval_id"] == "test_001"
+            assert stream.row_count == 1
+
+            stream.extend(sample_results[1:])
+
+        with open(stream.csv_file, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["eval_id"] for row in rows] == ["test_001", "test_002", "test_003"]
+        assert rows[1]["result"] == "FAIL"
+
+    def test_open_stream_without_results(self, tmp_path, empty_results):
+        """Test an empty run leaves neither a CSV nor a JSON file."""
+        with ResultsManager.open_stream(str(tmp_path)) as stream:
+            stream.extend(empty_results)
+        ResultsManager(empty_results).save_summary(stream.json_file)
+
+        assert stream.row_count == 0
+        assert not list(tmp_path.iterdir())
+
+    def test_open_stream_error(self, mocker: MockerFixture):
+        """Test stream opening with directory creation error."""
+        mocker.patch("pathlib.Path.mkdir", side_effect=OSError("Permission denied"))
+
+        with pytest.raises(AgentEvaluationError, match="Failed to open results file"):
+            with ResultsManager.open_stream("test_results/"):
+                pass
+
+    def test_save_summary(self, tmp_path, sample_results):
+        """Test summary JSON saving for streamed results."""
+        json_file = tmp_path / "summary.json"
+        ResultsManager(sample_results).save_summary(json_file)
+
+        with open(json_file, "r", encoding="utf-8") as f:
+            json_data = json.load(f)
+        assert json_data["summary"]["total_evaluations"] == 3
+        assert json_data["summary"]["failed"] == 1
+
+    def test_save_summary_empty_results(self, tmp_path, empty_results):
+        """Test summary is not saved without results."""
+        json_file = tmp_path / "summary.json"
+        ResultsManager(empty_results).save_summary(json_file)
+
+        assert not json_file.exists()
+
+    def test_save_summary_error(self, mocker: MockerFixture, sample_results):
+        """Test summary saving with a file write error."""
+        mocker.patch("builtins.open", side_effect=OSError("Permission denied"))
+
+        with pytest.raises(AgentEvaluationError, match="Failed to save summary"):
+            ResultsManager(sample_results).save_summary(Path("summary.json"))
@@ -289,6 +289,43 @@ class TestScriptRunner:
         assert result
         # Note: Instance method returns boolean, not the result object
 
+    def test_run_script_prepares_script_once(self, mocker: MockerFixture):
+        """Test script checks and chmod are done once per script path."""
+        mock_chmod = mocker.patch("pathlib.Path.chmod")
+        mock_exists = mocker.patch("pathlib.Path.exists", return_value=True)
+        mocker.patch("pathlib.Path.is_file", return_value=True)
+        mock_subprocess_run = mocker.patch("subprocess.run")
+        mock_subprocess_run.return_value.returncode = 0
+
+        runner = ScriptRunner()
+        assert runner.run_script("test_script.sh")
+        assert runner.run_script("test_script.sh")
+
+        assert mock_subprocess_run.call_count == 2
+        mock_exists.assert_called_once()
+        mock_chmod.assert_called_once_with(0o755)
+        first_env = mock_subprocess_run.call_args_list[0].kwargs["env"]
+        assert mock_subprocess_run.call_args_list[1].kwargs["env"] is first_env
+
+    def test_run_script_resolves_absolute_path_once(self, mocker: MockerFixture):
+        """Test absolute script paths are resolved once, relative ones every run."""
+        mocker.patch("pathlib.Path.chmod")
+        mocker.patch("pathlib.Path.exists", return_value=True)
+        mocker.patch("pathlib.Path.is_file", return_value=True)
+        mocker.patch("subprocess.run").return_value.returncode = 0
+        mock_resolve = mocker.patch(
+            "pathlib.Path.resolve", autospec=True, side_effect=lambda path: path
+        )
+
+        runner = ScriptRunner()
+        assert runner.run_script("/test/test_script.sh")
+        assert runner.run_script("/test/test_script.sh")
+        assert mock_resolve.call_count == 1
+
+        assert runner.run_script("test_script.sh")
+        assert runner.run_script("test_script.sh")
+        assert mock_resolve.call_count == 3
+
     def test_script_runner_init(self):
         """Test ScriptRunner initialization."""
         runner = ScriptRunner()
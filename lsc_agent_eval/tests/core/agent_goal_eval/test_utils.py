@@ -0,0 +1,62 @@
+"""Tests for evaluation processing utilities."""
+
+import pytest
+
+from lsc_agent_eval.core.agent_goal_eval.models import (
+    EvaluationDataConfig,
+    EvaluationResult,
+)
+from lsc_agent_eval.core.agent_goal_eval.utils import create_evaluation_results
+
+
+class TestCreateEvaluationResults:
+    """Test create_evaluation_results."""
+
+    @pytest.fixture
+    def eval_config(self):
+        """Sample evaluation configuration with multiple eval types."""
+        return EvaluationDataConfig(
+            eval_id="test_001",
+            eval_query="How do I scale my deployment?",
+            eval_types=["response_eval:intent", "tool_eval"],
+            expected_intent="provide instructions",
+            expected_tool_calls=[[{"tool_name": "oc_scale", "arguments": {}}]],
+            conversation_group="conv1",
+        )
+
+    def test_evaluation_results(self, eval_config):
+        """Test results match validated model construction."""
+        tool_calls = [[{"tool_name": "oc_scale", "arguments": {}}]]
+        results = create_evaluation_results(
+            eval_config,
+            response="Use oc scale",
+            evaluation_results=[
+                {"eval_type": "response_eval:intent", "result": "PASS", "error": None},
+                {"eval_type": "tool_eval", "result": "FAIL", "error": None},
+            ],
+            conversation_id="conv-id-123",
+            tool_calls=tool_calls,
+        )
+
+        assert [r.result for r in results] == ["PASS", "FAIL"]
+        assert results[0].expected_intent == "provide instructions"
+        assert results[0].tool_calls is None
+        assert results[1].tool_calls == tool_calls
+        for result in results:
+            assert EvaluationResult.model_validate(result.model_dump()) == result
+
+    def test_error_results(self, eval_config):
+        """Test error message creates ERROR result for every eval type."""
+        results = create_evaluation_results(
+            eval_config, error_message="API connection failed"
+        )
+
+        assert [r.eval_type for r in results] == eval_config.eval_types
+        assert all(r.result == "ERROR" for r in results)
+        assert all(r.error == "API connection failed" for r in results)
+        assert all(r.conversation_group == "conv1" for r in results)
+
+    def test_missing_results_and_error(self, eval_config):
+        """Test either evaluation results or error message is required."""
+        with pytest.raises(ValueError, match="Must provide either"):
+            create_evaluation_results(eval_config)
@@ -6,7 +6,12 @@ from pytest_mock import MockerFixture
 import httpx
 import pytest
 
-from lsc_agent_eval.core.utils.api_client import AgentHttpClient
+from lsc_agent_eval.core.utils.api_client import (
+    CLIENT_LIMITS,
+    CONNECT_TIMEOUT,
+    HTTP2_ENABLED,
+    AgentHttpClient,
+)
 from lsc_agent_eval.core.utils.exceptions import AgentAPIError
 
 
@@ -21,7 +26,11 @@ class TestAgentHttpClient:
         assert client.endpoint == "http://localhost:8080"
         assert client.version == "v1"
         mock_client.assert_called_once_with(
-            base_url="http://localhost:8080", verify=True, timeout=300.0
+            base_url="http://localhost:8080",
+            verify=True,
+            timeout=httpx.Timeout(300.0, connect=CONNECT_TIMEOUT),
+            limits=CLIENT_LIMITS,
+            http2=HTTP2_ENABLED,
         )
 
     def test_init_with_token_file(self, mocker: MockerFixture):
@@ -38,7 +47,11 @@ class TestAgentHttpClient:
         assert client.endpoint == "http://localhost:8080"
         assert client.version == "v1"
         mock_client.assert_called_once_with(
-            base_url="http://localhost:8080", verify=True, timeout=300.0
+            base_url="http://localhost:8080",
+            verify=True,
+            timeout=httpx.Timeout(300.0, connect=CONNECT_TIMEOUT),
+            limits=CLIENT_LIMITS,
+            http2=HTTP2_ENABLED,
         )
         mock_client.return_value.headers.update.assert_called_once_with(
             {"Authorization": "Bearer test-token-123"}
@@ -71,11 +84,13 @@ class TestAgentHttpClient:
         mock_response = mocker.Mock()
         response_text = "There are 80 namespaces."
         tool_calls_data = [{"name": "oc_get", "args": {"oc_get_args": ["namespaces"]}}]
-        mock_response.json.return_value = {
-            "response": response_text,
-            "conversation_id": "conv-id-123",
-            "tool_calls": tool_calls_data,
-        }
+        mock_response.content = json.dumps(
+            {
+                "response": response_text,
+                "conversation_id": "conv-id-123",
+                "tool_calls": tool_calls_data,
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         # Mock HTTP client
@@ -102,7 +117,6 @@ class TestAgentHttpClient:
         mock_client.post.assert_called_once_with(
             "/v1/query",
             json=api_input,
-            timeout=300,
         )
 
     def test_query_agent_success_empty_tool_calls(self, mocker: MockerFixture):
@@ -110,11 +124,13 @@ class TestAgentHttpClient:
         # Mock HTTP response with empty tool_calls
         mock_response = mocker.Mock()
         response_text = "OpenShift Virtualization is an extension of the OpenShift Container Platform"
-        mock_response.json.return_value = {
-            "response": response_text,
-            "conversation_id": "conv-id-123",
-            "tool_calls": [],
-        }
+        mock_response.content = json.dumps(
+            {
+                "response": response_text,
+                "conversation_id": "conv-id-123",
+                "tool_calls": [],
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         # Mock HTTP client
@@ -176,7 +192,7 @@ class TestAgentHttpClient:
         """Test agent query with missing response field."""
         # Mock HTTP response without 'response' field
         mock_response = mocker.Mock()
-        mock_response.json.return_value = {"error": "Invalid request"}
+        mock_response.content = json.dumps({"error": "Invalid request"}).encode()
         mock_response.raise_for_status.return_value = None
 
         # Mock HTTP client
@@ -258,7 +274,6 @@ class TestAgentHttpClient:
             "POST",
             "/v1/streaming_query",
             json=api_input,
-            timeout=300,
         )
 
         mock_parser.assert_called_once_with(mock_response)
@@ -0,0 +1,29 @@
+"""Tests for JSON loader."""
+
+import json
+
+import pytest
+
+from lsc_agent_eval.core.utils.json_loader import json_loads
+
+
+class TestJsonLoads:
+    """Test json_loads."""
+
+    @pytest.mark.parametrize(
+        "data", ['{"response": "ok", "n": 1}', b'{"response": "ok", "n": 1}']
+    )
+    def test_json_loads(self, data):
+        """Test JSON is parsed from str and bytes."""
+        assert json_loads(data) == {"response": "ok", "n": 1}
+
+    def test_json_loads_utf8_bytes(self):
+        """Test non-ASCII content in UTF-8 bytes."""
+        assert json_loads('{"response": "café"}'.encode("utf-8")) == {
+            "response": "café"
+        }
+
+    def test_json_loads_invalid(self):
+        """Test invalid JSON raises stdlib JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads('{"invalid json": malformed}')
@@ -4,15 +4,34 @@ import os
 import re
 from pytest_mock import MockerFixture
 
+import httpx
 import pytest
+from litellm.exceptions import RateLimitError
 
+from lsc_agent_eval.core.utils.constants import MAX_RETRY_DELAY, TIME_TO_BREATH
 from lsc_agent_eval.core.utils.exceptions import JudgeModelError
-from lsc_agent_eval.core.utils.judge import JudgeModelManager
+from lsc_agent_eval.core.utils.judge import (
+    JudgeEnsemble,
+    JudgeModelManager,
+    _get_retry_delay,
+    parse_judge_spec,
+)
 
 
 class TestJudgeModelManager:
     """Test JudgeModelManager."""
 
+    @pytest.fixture
+    def mock_litellm(self, mocker: MockerFixture):
+        """Mock LiteLLM with a completion returning a '1' verdict."""
+        mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
+        mock_message = mocker.Mock()
+        mock_message.content = "1"
+        mock_choice = mocker.Mock()
+        mock_choice.message = mock_message
+        mock_litellm.completion.return_value.choices = [mock_choice]
+        return mock_litellm
+
     def test_init_openai_success(self, mocker: MockerFixture):
         """Test initializing OpenAI judge model."""
         mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
@@ -30,7 +49,7 @@ class TestJudgeModelManager:
         ):
             JudgeModelManager("openai", "gpt-4")
 
-    def test_init_azure_success(self, mocker: MockerFixture):
+    def test_init_azure_success(self, mocker: MockerFixture, mock_litellm):
         """Test initializing Azure judge model."""
         mocker.patch.dict(
             os.environ,
@@ -46,7 +65,13 @@ class TestJudgeModelManager:
         assert judge.judge_model == "gpt-4"
         assert judge.model_name == "azure/gpt-4-deployment"
 
-    def test_init_watsonx_success(self, mocker: MockerFixture):
+        judge.evaluate_response("Test prompt")
+        completion_kwargs = mock_litellm.completion.call_args.kwargs
+        assert completion_kwargs["model"] == "azure/gpt-4-deployment"
+        assert completion_kwargs["api_key"] == "test-key"
+        assert completion_kwargs["api_base"] == "https://test.openai.azure.com"
+
+    def test_init_watsonx_success(self, mocker: MockerFixture, mock_litellm):
         """Test initializing Watsonx judge model."""
         mocker.patch.dict(
             os.environ,
@@ -62,7 +87,13 @@ class TestJudgeModelManager:
         assert judge.judge_model == "granite-3-8b-instruct"
         assert judge.model_name == "watsonx/granite-3-8b-instruct"
 
-    def test_init_generic_provider(self, mocker: MockerFixture):
+        judge.evaluate_response("Test prompt")
+        completion_kwargs = mock_litellm.completion.call_args.kwargs
+        assert completion_kwargs["api_key"] == "test-key"
+        assert completion_kwargs["api_base"] == "https://test.watsonx.ibm.com"
+        assert completion_kwargs["project_id"] == "test-project"
+
+    def test_init_generic_provider(self, mocker: MockerFixture, mock_litellm):
         """Test initializing generic provider."""
         mock_logger = mocker.patch("lsc_agent_eval.core.utils.judge.logger")
         judge = JudgeModelManager("xyz", "abcd")
@@ -74,6 +105,9 @@ class TestJudgeModelManager:
             "Using generic provider format for %s", "xyz"
         )
 
+        judge.evaluate_response("Test prompt")
+        assert "api_key" not in mock_litellm.completion.call_args.kwargs
+
     def test_init_setup_failure(self, mocker: MockerFixture):
         """Test judge model setup failure."""
         mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
@@ -109,8 +143,69 @@ class TestJudgeModelManager:
             messages=[{"role": "user", "content": "Test prompt"}],
             temperature=0.0,
             timeout=300,
+            api_key="test-key",
         )
 
+    def test_evaluate_response_with_system_prompt(self, mocker: MockerFixture):
+        """Test system prompt is sent as a separate leading message."""
+        mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
+        mock_response = mocker.Mock()
+        mock_message = mocker.Mock()
+        mock_message.content = "0"
+        mock_choice = mocker.Mock()
+        mock_choice.message = mock_message
+        mock_response.choices = [mock_choice]
+        mock_litellm.completion.return_value = mock_response
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        judge = JudgeModelManager("openai", "gpt-4")
+        result = judge.evaluate_response("Test prompt", system_prompt="Rubric")
+
+        assert result == "0"
+        mock_litellm.completion.assert_called_once_with(
+            model="gpt-4",
+            messages=[
+                {"role": "system", "content": "Rubric"},
+                {"role": "user", "content": "Test prompt"},
+            ],
+            temperature=0.0,
+            timeout=300,
+            api_key="test-key",
+        )
+
+    def test_evaluate_response_uses_cache(self, mocker: MockerFixture, tmp_path):
+        """Test cached judge response skips LiteLLM on repeated prompts."""
+        mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
+        mock_response = mocker.Mock()
+        mock_message = mocker.Mock()
+        mock_message.content = " 1 "
+        mock_choice = mocker.Mock()
+        mock_choice.message = mock_message
+        mock_response.choices = [mock_choice]
+        mock_litellm.completion.return_value = mock_response
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        judge = JudgeModelManager("openai", "gpt-4", cache_dir=str(tmp_path))
+
+        assert judge.evaluate_response("Test prompt") == "1"
+        assert judge.evaluate_response("Test prompt") == "1"
+        mock_litellm.completion.assert_called_once()
+
+        # New manager instance reads the response back from disk; credentials
+        # are not part of the cache key
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "rotated-key"})
+        judge = JudgeModelManager("openai", "gpt-4", cache_dir=str(tmp_path))
+        assert judge.evaluate_response("Test prompt") == "1"
+        mock_litellm.completion.assert_called_once()
+
+        # Different completion kwargs are not served from the cache
+        mock_litellm.encode.side_effect = [[15], [16]]
+        judge = JudgeModelManager(
+            "openai", "gpt-4", cache_dir=str(tmp_path), constrain_output=True
+        )
+        assert judge.evaluate_response("Test prompt") == "1"
+        assert mock_litellm.completion.call_count == 2
+
     def test_evaluate_response_invalid_structure(self, mocker: MockerFixture):
         """Test response evaluation with invalid response structure."""
         mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
@@ -155,6 +250,54 @@ class TestJudgeModelManager:
         mock_logger.warning.assert_called_once()
         mock_sleep.assert_called_once()
 
+    def test_evaluate_response_rate_limit_retry(self, mocker: MockerFixture):
+        """Test rate limited judge call is retried after Retry-After delay."""
+        mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
+        mock_sleep = mocker.patch("lsc_agent_eval.core.utils.judge.sleep")
+
+        mock_response = mocker.Mock()
+        mock_response.choices = [mocker.Mock(message=mocker.Mock(content="1"))]
+        rate_limit_error = RateLimitError(
+            message="Too many requests",
+            llm_provider="openai",
+            model="gpt-4",
+            response=httpx.Response(
+                429,
+                headers={"retry-after": "7"},
+                request=httpx.Request("POST", "https://api.openai.com"),
+            ),
+        )
+        mock_litellm.completion.side_effect = [rate_limit_error, mock_response]
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        judge = JudgeModelManager("openai", "gpt-4")
+
+        assert judge.evaluate_response("Test prompt") == "1"
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_evaluate_response_non_retryable_error(self, mocker: MockerFixture):
+        """Test non-transient errors are not retried."""
+        mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
+        mock_sleep = mocker.patch("lsc_agent_eval.core.utils.judge.sleep")
+        mock_litellm.completion.side_effect = ValueError("Invalid request")
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        judge = JudgeModelManager("openai", "gpt-4")
+
+        with pytest.raises(ValueError, match="Invalid request"):
+            judge.evaluate_response("Test prompt")
+        assert mock_litellm.completion.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_get_retry_delay_exponential_backoff(self, mocker: MockerFixture):
+        """Test retry delay doubles per attempt with jitter and is capped."""
+        mocker.patch("lsc_agent_eval.core.utils.judge.random.random", return_value=1.0)
+        error = TimeoutError("Request timeout")
+
+        assert _get_retry_delay(error, 0) == TIME_TO_BREATH
+        assert _get_retry_delay(error, 1) == TIME_TO_BREATH * 2
+        assert _get_retry_delay(error, 10) == MAX_RETRY_DELAY
+
     def test_evaluate_response_max_retries_exceeded(self, mocker: MockerFixture):
         """Test response evaluation with max retries exceeded."""
         mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
@@ -210,8 +353,83 @@ class TestJudgeModelManager:
         ):
             judge.evaluate_response("Test prompt")
 
+    def test_init_constrained_output(self, mocker: MockerFixture, mock_litellm):
+        """Test constrained output restricts judge to single verdict tokens."""
+        mock_litellm.encode.side_effect = lambda model, text: [15 + int(text)]
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        judge = JudgeModelManager("openai", "gpt-4", constrain_output=True)
+        judge.evaluate_response("Test prompt")
+
+        completion_kwargs = mock_litellm.completion.call_args.kwargs
+        assert completion_kwargs["logit_bias"] == {"15": 100, "16": 100}
+        assert completion_kwargs["max_tokens"] == 1
+
+    def test_init_constrained_output_multi_token_verdict(self, mocker: MockerFixture):
+        """Test constrained output fails when a verdict is not a single token."""
+        mock_litellm = mocker.patch("lsc_agent_eval.core.utils.judge.litellm")
+        mock_litellm.encode.return_value = [15, 16]
+
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        with pytest.raises(JudgeModelError, match="is not a single token"):
+            JudgeModelManager("openai", "gpt-4", constrain_output=True)
+
+    def test_init_constrained_output_unsupported_provider(
+        self, mocker: MockerFixture, mock_litellm
+    ):
+        """Test constrained output is ignored for providers without logit_bias."""
+        mocker.patch.dict(
+            os.environ,
+            {
+                "WATSONX_API_KEY": "test-key",
+                "WATSONX_API_BASE": "https://test.watsonx.ibm.com",
+                "WATSONX_PROJECT_ID": "test-project",
+            },
+        )
+        judge = JudgeModelManager("watsonx", "granite", constrain_output=True)
+        judge.evaluate_response("Test prompt")
+
+        completion_kwargs = mock_litellm.completion.call_args.kwargs
+        assert "logit_bias" not in completion_kwargs
+        assert "max_tokens" not in completion_kwargs
+
     def test_get_model_name(self, mocker: MockerFixture):
         """Test get_model_name method."""
         mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
         judge = JudgeModelManager("openai", "gpt-4")
         assert judge.get_model_name() == "gpt-4"
+
+
+class TestJudgeEnsemble:
+    """Test JudgeEnsemble."""
+
+    def test_parse_judge_spec(self):
+        """Test parsing 'provider:model' judge specification."""
+        assert parse_judge_spec("openai:gpt-4o-mini") == ("openai", "gpt-4o-mini")
+        assert parse_judge_spec("ollama:llama3:8b") == ("ollama", "llama3:8b")
+
+    @pytest.mark.parametrize("judge_spec", ["gpt-4", "openai:", ":gpt-4"])
+    def test_parse_judge_spec_invalid(self, judge_spec):
+        """Test invalid judge specification."""
+        with pytest.raises(JudgeModelError, match="expected format is"):
+            parse_judge_spec(judge_spec)
+
+    def test_init_without_judges(self):
+        """Test ensemble requires at least one judge."""
+        with pytest.raises(JudgeModelError, match="at least one judge"):
+            JudgeEnsemble([])
+
+    def test_evaluate_responses(self, mocker: MockerFixture):
+        """Test all judges are queried and responses keep judge order."""
+        judges = [mocker.Mock(spec=JudgeModelManager) for _ in range(3)]
+        for judge, response in zip(judges, ["1", "0", "1"]):
+            judge.evaluate_response.return_value = response
+            judge.get_model_name.return_value = f"model-{response}"
+
+        ensemble = JudgeEnsemble(judges)
+        responses = ensemble.evaluate_responses("Test prompt", system_prompt="Rubric")
+
+        assert responses == ["1", "0", "1"]
+        for judge in judges:
+            judge.evaluate_response.assert_called_once_with("Test prompt", "Rubric")
+        assert ensemble.get_model_names() == ["model-1", "model-0", "model-1"]
@@ -0,0 +1,55 @@
+"""Tests for judge response cache."""
+
+import json
+
+from lsc_agent_eval.core.utils.judge_cache import JudgeCache
+
+PARAMS = {"model": "gpt-4", "temperature": 0.0, "timeout": 300}
+MESSAGES = [{"role": "user", "content": "prompt"}]
+OTHER_MESSAGES = [
+    {"role": "system", "content": "instructions"},
+    {"role": "user", "content": "prompt"},
+]
+
+
+class TestJudgeCache:
+    """Test JudgeCache."""
+
+    def test_get_missing_entry(self, tmp_path):
+        """Test cache miss returns None."""
+        cache = JudgeCache(str(tmp_path / "cache"))
+
+        assert cache.get(PARAMS, MESSAGES) is None
+        assert (tmp_path / "cache").is_dir()
+
+    def test_set_and_get(self, tmp_path):
+        """Test stored response is returned for same request params and prompt."""
+        cache = JudgeCache(str(tmp_path))
+        cache.set(PARAMS, MESSAGES, "1")
+
+        assert cache.get(PARAMS, MESSAGES) == "1"
+        assert cache.get(PARAMS, OTHER_MESSAGES) is None
+        assert cache.get({**PARAMS, "model": "gpt-4o"}, MESSAGES) is None
+        assert cache.get({**PARAMS, "temperature": 0.7}, MESSAGES) is None
+        assert cache.get({**PARAMS, "max_tokens": 1}, MESSAGES) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries are read back from disk by a new cache instance."""
+        JudgeCache(str(tmp_path)).set(PARAMS, MESSAGES, "0")
+
+        entries = list(tmp_path.glob("*.json"))
+        assert len(entries) == 1
+        assert json.loads(entries[0].read_text(encoding="utf-8")) == {
+            "model": "gpt-4",
+            "response": "0",
+        }
+        assert JudgeCache(str(tmp_path)).get(PARAMS, MESSAGES) == "0"
+
+    def test_invalid_entry_ignored(self, tmp_path):
+        """Test corrupted cache entry is treated as a miss."""
+        cache = JudgeCache(str(tmp_path))
+        cache.set(PARAMS, MESSAGES, "1")
+        entry = next(tmp_path.glob("*.json"))
+        entry.write_text("not json", encoding="utf-8")
+
+        assert JudgeCache(str(tmp_path)).get(PARAMS, MESSAGES) is None
@@ -31,6 +31,8 @@ class TestArgsParser:
         assert parsed.agent_api_version == "v1"  # default
         assert parsed.result_dir == "eval_output/"  # default
         assert parsed.endpoint_type == "streaming"  # default
+        assert parsed.max_inflight == 1  # default
+        assert parsed.additional_judges is None  # default
 
     def test_args_parser_all_arguments(self):
         """Test argument parser with all arguments."""
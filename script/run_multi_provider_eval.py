@@ -38,6 +38,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Use the libyaml bindings when PyYAML was built with them
+SafeYamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeYamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _run_evaluation_worker(
     provider_name: str,
@@ -101,7 +105,7 @@ def _run_evaluation_worker(
 
         # Load and modify system config
         with open(system_config_path, "r", encoding="utf-8") as f:
-            system_config = yaml.safe_load(f)
+            system_config = yaml.load(f, Loader=SafeYamlLoader)
 
         # Deep copy and modify for this provider-model
         modified_config = copy.deepcopy(system_config)
@@ -121,7 +125,11 @@ def _run_evaluation_worker(
 
         try:
             yaml.dump(
-                modified_config, temp_file, default_flow_style=False, sort_keys=False
+                modified_config,
+                temp_file,
+                Dumper=SafeYamlDumper,
+                default_flow_style=False,
+                sort_keys=False,
             )
             temp_file.flush()
         finally:
@@ -309,7 +317,7 @@ class MultiProviderEvaluationRunner:
         """
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeYamlLoader)
                 if data is None:
                     return {}
                 if not isinstance(data, dict):
@@ -419,7 +427,11 @@ class MultiProviderEvaluationRunner:
 
         try:
             yaml.dump(
-                modified_config, temp_file, default_flow_style=False, sort_keys=False
+                modified_config,
+                temp_file,
+                Dumper=SafeYamlDumper,
+                default_flow_style=False,
+                sort_keys=False,
             )
             temp_file.flush()
             return temp_path
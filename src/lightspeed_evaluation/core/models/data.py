@@ -792,15 +792,23 @@ class EvaluationRequest(BaseModel):
         default=None, description="Turn data for turn-level evaluation"
     )
 
-    # Computed field for convenience
+    # Computed fields for convenience
     turn_id: Optional[str] = Field(
         default=None, description="Turn ID extracted from turn_data"
     )
+    framework: str = Field(
+        default="", description="Framework extracted from metric_identifier"
+    )
+    metric_name: str = Field(
+        default="", description="Metric name extracted from metric_identifier"
+    )
 
     def model_post_init(self, context: Any, /) -> None:
         """Post-initialization to set computed fields."""
         if self.turn_data:
             self.turn_id = self.turn_data.turn_id  # pylint: disable=no-member
+        # Split once here instead of on every evaluation step
+        self.framework, _, self.metric_name = self.metric_identifier.partition(":")
 
     @classmethod
     def for_turn(
@@ -114,6 +114,14 @@ class CoreConfig(BaseModel):
         description="Maximum threads for multithreading eval",
         gt=0,
     )
+    max_metric_threads: int = Field(
+        default=1,
+        description=(
+            "Maximum metrics of a single turn evaluated concurrently, "
+            "per conversation thread"
+        ),
+        gt=0,
+    )
     fail_on_invalid_data: bool = Field(
         default=True,
         description="If False don't fail on invalid conversations",
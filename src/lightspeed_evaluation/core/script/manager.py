@@ -80,13 +80,15 @@ class ScriptExecutionManager:  # pylint: disable=too-few-public-methods
             )
 
     def _execute_script(self, script_path: Path) -> subprocess.CompletedProcess:
-        """Execute the script and return the result."""
-        env = os.environ.copy()
+        """Execute the script and return the result.
+
+        The script inherits the current process environment (including
+        KUBECONFIG) directly, without building a copy of it per run.
+        """
         return subprocess.run(
             [str(script_path)],
             text=True,
             capture_output=True,
-            env=env,
             cwd=script_path.parent,
             timeout=self.timeout,
             check=False,
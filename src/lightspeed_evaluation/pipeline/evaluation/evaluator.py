@@ -107,11 +107,13 @@ class MetricsEvaluator:
         if config_loader.system_config is None:
             raise RuntimeError("Uninitialized system_config")
 
-        self.system_config = config_loader.system_config
-        self.llm_manager = LLMManager.from_system_config(config_loader.system_config)
-        self.embedding_manager = EmbeddingManager.from_system_config(
-            config_loader.system_config
+        system_config = config_loader.system_config
+        # Script metrics need the agent API; without it they are skipped
+        self._script_disabled = (
+            system_config.agents is None or not system_config.agents.enabled
         )
+        self.llm_manager = LLMManager.from_system_config(system_config)
+        self.embedding_manager = EmbeddingManager.from_system_config(system_config)
 
         # Initialize default metric handlers (used for primary judge or non-panel metrics)
         self.handlers = {
@@ -149,12 +151,16 @@ class MetricsEvaluator:
         raise ConfigurationError(f"Unsupported LLM framework for panel: {framework}")
 
     def evaluate_metric(  # pylint: disable=too-many-locals
-        self, request: EvaluationRequest
+        self,
+        request: EvaluationRequest,
+        evaluation_scope: Optional[EvaluationScope] = None,
     ) -> Optional[EvaluationResult]:
         """Evaluate a single metric and return complete evaluation result.
 
         Args:
             request: Evaluation request with conversation data and metric identifier.
+            evaluation_scope: Scope shared by all metrics of the same turn or
+                conversation. Built from the request when not provided.
 
         Returns:
             EvaluationResult with score, result, token usage, and execution time,
@@ -163,28 +169,24 @@ class MetricsEvaluator:
         start_time = time.perf_counter()
 
         try:
-            # Create logging summary
+            # Lazy %-args: nothing is formatted unless DEBUG is enabled
             if request.is_conversation:
-                summary = (
-                    f"Conversation {request.conv_data.conversation_group_id} - "
-                    f"{request.metric_identifier}"
+                logger.debug(
+                    "Evaluating: Conversation %s - %s",
+                    request.conv_data.conversation_group_id,
+                    request.metric_identifier,
                 )
             else:
-                summary = f"Turn {request.turn_id} - {request.metric_identifier}"
-            logger.debug("Evaluating: %s", summary)
-
-            # Parse framework and metric
-            framework = request.metric_identifier.split(":", 1)[0]
-
-            # Skip script metrics if API is disabled
-            sys_config = self.config_loader.system_config
-            agents_enabled = (
-                sys_config is not None
-                and sys_config.agents is not None
-                and sys_config.agents.enabled
-            )
-            if framework == "script" and not agents_enabled:
-                # Don't generate result for script metrics when API disabled
+                logger.debug(
+                    "Evaluating: Turn %s - %s",
+                    request.turn_id,
+                    request.metric_identifier,
+                )
+
+            framework = request.framework
+
+            # Don't generate result for script metrics when API disabled
+            if framework == "script" and self._script_disabled:
                 return None
 
             # Route to appropriate handler
@@ -207,12 +209,12 @@ class MetricsEvaluator:
                     )
                     return self._create_error_result(request, msg, start_time)
 
-            # Create evaluation scope
-            evaluation_scope = EvaluationScope(
-                turn_idx=request.turn_idx,
-                turn_data=request.turn_data,
-                is_conversation=request.is_conversation,
-            )
+            if evaluation_scope is None:
+                evaluation_scope = EvaluationScope(
+                    turn_idx=request.turn_idx,
+                    turn_data=request.turn_data,
+                    is_conversation=request.is_conversation,
+                )
 
             # Get threshold
             level = (
@@ -274,23 +276,21 @@ class MetricsEvaluator:
                 request, f"Evaluation error: {e}", start_time
             )
 
-    def _will_use_panel(self, metric_identifier: str) -> bool:
+    def _will_use_panel(self, request: EvaluationRequest) -> bool:
         """Check if panel of judges will be used for this metric.
 
         Args:
-            metric_identifier: Metric identifier (e.g., 'ragas:faithfulness').
+            request: Evaluation request, with its metric framework already parsed.
 
         Returns:
             True if panel evaluation will be used, False otherwise.
         """
-        framework = metric_identifier.split(":", 1)[0]
-
         # Non-LLM frameworks never use panel
-        if framework in NON_LLM_FRAMEWORKS:
+        if request.framework in NON_LLM_FRAMEWORKS:
             return False
 
         # should_use_panel_for_metric handles the no-panel case internally
-        return self.llm_manager.should_use_panel_for_metric(metric_identifier)
+        return self.llm_manager.should_use_panel_for_metric(request.metric_identifier)
 
     def _evaluate_wrapper(  # pylint: disable=too-many-locals,too-many-statements
         self,
@@ -333,7 +333,7 @@ class MetricsEvaluator:
             )
 
             # Check if panel of judges will be used
-            uses_panel = self._will_use_panel(request.metric_identifier)
+            uses_panel = self._will_use_panel(request)
 
             # Panel of judges: skip multiple expected responses (use first only)
             # This is a design choice to avoid N judges x M expected_responses complexity
@@ -679,7 +679,7 @@ class MetricsEvaluator:
             MetricResult with score, result, reason, and judge llm token counts.
             For multi-judge evaluation, includes per-judge scores in judge_scores field.
         """
-        framework = request.metric_identifier.split(":", 1)[0]
+        framework = request.framework
 
         # Non-LLM metrics: no judge LLM involved (nlp, script)
         if framework in NON_LLM_FRAMEWORKS:
@@ -701,7 +701,7 @@ class MetricsEvaluator:
         These metrics don't use judge LLM, so judge_scores is None and
         token counts are always 0.
         """
-        framework, metric_name = request.metric_identifier.split(":", 1)
+        framework, metric_name = request.framework, request.metric_name
 
         status = "ERROR"
         score, reason = self.handlers[framework].evaluate(
@@ -77,8 +77,7 @@ class JudgeOrchestrator:
         Returns:
             MetricResult with aggregated score and individual judge scores.
         """
-        # Extract framework and metric_name from identifier
-        framework, metric_name = request.metric_identifier.split(":", 1)
+        framework, metric_name = request.framework, request.metric_name
 
         # Get judges for this metric (panel or single based on enabled_metrics)
         judge_managers = self.llm_manager.get_judges_for_metric(
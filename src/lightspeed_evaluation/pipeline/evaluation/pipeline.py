@@ -306,6 +306,7 @@ class EvaluationPipeline:  # pylint: disable=too-many-instance-attributes
         pipelines, since ``litellm.cache`` is process-global state.
         """
         self._default_driver.close()
+        self.conversation_processor.close()
 
         self.storage_backend.close()
 
@@ -1,7 +1,11 @@
 """Conversation processing module - handles conversation and turn processing."""
 
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from typing import Optional
 
 from lightspeed_evaluation.core.metrics.manager import MetricLevel, MetricManager
@@ -9,6 +13,7 @@ from lightspeed_evaluation.core.models import (
     EvaluationData,
     EvaluationRequest,
     EvaluationResult,
+    EvaluationScope,
     TurnData,
 )
 from lightspeed_evaluation.core.script import (
@@ -53,6 +58,23 @@ class ConversationProcessor:
         self.config = config_loader.system_config
         self.components = components
 
+        # Metrics of a turn may be evaluated concurrently, up to
+        # max_metric_threads in flight per turn. All conversation workers share
+        # this processor, so the pool is sized for every one of them.
+        self._max_metric_threads = (
+            self.config.core.max_metric_threads if self.config else 1
+        )
+        self._metric_executor: Optional[ThreadPoolExecutor] = None
+        if self.config and self._max_metric_threads > 1:
+            # Same default as the conversation pool when max_threads is null
+            conversation_threads = self.config.core.max_threads or min(
+                32, (os.cpu_count() or 1) + 4
+            )
+            self._metric_executor = ThreadPoolExecutor(
+                max_workers=conversation_threads * self._max_metric_threads,
+                thread_name_prefix="metric-eval",
+            )
+
     def process_conversation(
         self, conv_data: EvaluationData, agent_driver: AgentDriver
     ) -> list[EvaluationResult]:
@@ -272,7 +294,8 @@ class ConversationProcessor:
         turn_metrics: list[str],
     ) -> list[EvaluationResult]:
         """Evaluate single turn with specified turn metrics."""
-        results = []
+        results: list[Optional[EvaluationResult]] = []
+        requests: dict[int, EvaluationRequest] = {}
 
         for metric_identifier in turn_metrics:
             if turn_data.is_metric_invalid(metric_identifier):
@@ -290,37 +313,22 @@ class ConversationProcessor:
                 )
                 continue
 
-            request = EvaluationRequest.for_turn(
+            requests[len(results)] = EvaluationRequest.for_turn(
                 conv_data, metric_identifier, turn_idx, turn_data
             )
-            try:
-                result = self.components.metrics_evaluator.evaluate_metric(request)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                error_reason = f"{type(e).__name__}: {e}"
-                logger.error(
-                    "%s evaluation failed for conversation %s turn %d: %s",
-                    metric_identifier,
-                    conv_data.conversation_group_id,
-                    turn_idx,
-                    error_reason,
-                )
-                result = self.components.error_handler.create_error_result(
-                    conv_data.conversation_group_id,
-                    metric_identifier,
-                    error_reason,
-                    tag=conv_data.tag,
-                    turn_id=turn_data.turn_id,
-                    query=turn_data.query or "",
-                )
-            if result:
-                results.append(result)
-        return results
+            results.append(None)
+
+        evaluation_scope = EvaluationScope(
+            turn_idx=turn_idx, turn_data=turn_data, is_conversation=False
+        )
+        return self._collect_results(results, requests, evaluation_scope)
 
     def _evaluate_conversation(
         self, conv_data: EvaluationData, conversation_metrics: list[str]
     ) -> list[EvaluationResult]:
         """Evaluate conversation-level metrics."""
-        results = []
+        results: list[Optional[EvaluationResult]] = []
+        requests: dict[int, EvaluationRequest] = {}
 
         for metric_identifier in conversation_metrics:
             if conv_data.is_metric_invalid(metric_identifier):
@@ -338,26 +346,88 @@ class ConversationProcessor:
                 )
                 continue
 
-            request = EvaluationRequest.for_conversation(conv_data, metric_identifier)
-            try:
-                result = self.components.metrics_evaluator.evaluate_metric(request)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                error_reason = f"{type(e).__name__}: {e}"
+            requests[len(results)] = EvaluationRequest.for_conversation(
+                conv_data, metric_identifier
+            )
+            results.append(None)
+
+        evaluation_scope = EvaluationScope(is_conversation=True)
+        return self._collect_results(results, requests, evaluation_scope)
+
+    def _collect_results(
+        self,
+        results: list[Optional[EvaluationResult]],
+        requests: dict[int, EvaluationRequest],
+        evaluation_scope: EvaluationScope,
+    ) -> list[EvaluationResult]:
+        """Evaluate requests into their result slots, keeping metric order.
+
+        Args:
+            results: Result slots in metric order, None where a request is pending.
+            requests: Pending evaluation requests keyed by their result slot.
+            evaluation_scope: Scope shared by all the requests.
+
+        Returns:
+            Evaluated results in metric order, without skipped metrics.
+        """
+        evaluate = partial(self._evaluate_request, evaluation_scope=evaluation_scope)
+        if self._metric_executor is None or len(requests) < 2:
+            for slot, request in requests.items():
+                results[slot] = evaluate(request)
+            return [result for result in results if result]
+
+        # Metrics of a turn are independent; overlap their judge LLM calls while
+        # keeping at most max_metric_threads of them in flight for this turn
+        in_flight: deque[tuple[int, Future[Optional[EvaluationResult]]]] = deque()
+        for slot, request in requests.items():
+            if len(in_flight) >= self._max_metric_threads:
+                done_slot, future = in_flight.popleft()
+                results[done_slot] = future.result()
+            in_flight.append((slot, self._metric_executor.submit(evaluate, request)))
+        for slot, future in in_flight:
+            results[slot] = future.result()
+        return [result for result in results if result]
+
+    def _evaluate_request(
+        self, request: EvaluationRequest, evaluation_scope: EvaluationScope
+    ) -> Optional[EvaluationResult]:
+        """Evaluate a single metric request, converting failures to ERROR result."""
+        conv_data = request.conv_data
+        try:
+            return self.components.metrics_evaluator.evaluate_metric(
+                request, evaluation_scope
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error_reason = f"{type(e).__name__}: {e}"
+            if request.is_conversation or request.turn_data is None:
                 logger.error(
                     "%s evaluation failed for conversation %s: %s",
-                    metric_identifier,
+                    request.metric_identifier,
                     conv_data.conversation_group_id,
                     error_reason,
                 )
-                result = self.components.error_handler.create_error_result(
+                return self.components.error_handler.create_error_result(
                     conv_data.conversation_group_id,
-                    metric_identifier,
+                    request.metric_identifier,
                     error_reason,
                     tag=conv_data.tag,
                 )
-            if result:
-                results.append(result)
-        return results
+
+            logger.error(
+                "%s evaluation failed for conversation %s turn %d: %s",
+                request.metric_identifier,
+                conv_data.conversation_group_id,
+                request.turn_idx,
+                error_reason,
+            )
+            return self.components.error_handler.create_error_result(
+                conv_data.conversation_group_id,
+                request.metric_identifier,
+                error_reason,
+                tag=conv_data.tag,
+                turn_id=request.turn_data.turn_id,
+                query=request.turn_data.query or "",
+            )
 
     def _run_setup_script(
         self, conv_data: EvaluationData, skip_setup: bool = False
@@ -413,6 +483,12 @@ class ConversationProcessor:
         except ScriptExecutionError as e:
             logger.warning("Cleanup script failed: %s", e)
 
+    def close(self) -> None:
+        """Shut down the metric evaluation thread pool, if any."""
+        if self._metric_executor is not None:
+            self._metric_executor.shutdown(wait=True)
+            self._metric_executor = None
+
     def get_metrics_summary(self, conv_data: EvaluationData) -> dict[str, int]:
         """Get summary of metrics to be evaluated for a conversation."""
         return self.components.metric_manager.count_metrics_for_conversation(conv_data)
@@ -2,13 +2,17 @@
 
 """Pytest configuration and fixtures for script tests."""
 
+import copy
 from pathlib import Path
 from typing import Any
 
 import pytest
 import yaml
 
-from script.run_multi_provider_eval import MultiProviderEvaluationRunner
+from script.run_multi_provider_eval import (
+    MultiProviderEvaluationRunner,
+    SafeYamlDumper,
+)
 
 
 @pytest.fixture
@@ -66,9 +70,14 @@ def sample_evaluation_data() -> tuple[list[dict], list[dict]]:
     return sample_results1, sample_results2
 
 
-@pytest.fixture
-def temp_config_files(tmp_path: Path) -> dict:
-    """Create temporary configuration files for testing."""
+@pytest.fixture(scope="module")
+def temp_config_files(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Create temporary configuration files for testing.
+
+    The files are written once per test module and must not be modified by
+    tests; tests that need a different config write their own under tmp_path.
+    """
+    tmp_path = tmp_path_factory.mktemp("config")
     # Create multi_eval_config.yaml
     providers_config = {
         "providers": {
@@ -83,7 +92,7 @@ def temp_config_files(tmp_path: Path) -> dict:
     }
     providers_path = tmp_path / "multi_eval_config.yaml"
     with open(providers_path, "w", encoding="utf-8") as f:
-        yaml.dump(providers_config, f)
+        yaml.dump(providers_config, f, Dumper=SafeYamlDumper)
 
     # Create system.yaml
     system_config = {
@@ -97,7 +106,7 @@ def temp_config_files(tmp_path: Path) -> dict:
     }
     system_path = tmp_path / "system.yaml"
     with open(system_path, "w", encoding="utf-8") as f:
-        yaml.dump(system_config, f)
+        yaml.dump(system_config, f, Dumper=SafeYamlDumper)
 
     # Create evaluation_data.yaml
     eval_data = [
@@ -117,7 +126,7 @@ def temp_config_files(tmp_path: Path) -> dict:
     ]
     eval_path = tmp_path / "evaluation_data.yaml"
     with open(eval_path, "w", encoding="utf-8") as f:
-        yaml.dump(eval_data, f)
+        yaml.dump(eval_data, f, Dumper=SafeYamlDumper)
 
     return {
         "providers_config": providers_path,
@@ -127,11 +136,11 @@ def temp_config_files(tmp_path: Path) -> dict:
     }
 
 
-@pytest.fixture
-def runner(
+@pytest.fixture(scope="module")
+def runner_template(
     temp_config_files: dict,
 ) -> MultiProviderEvaluationRunner:
-    """Create a MultiProviderEvaluationRunner instance for testing."""
+    """Create a MultiProviderEvaluationRunner once per test module."""
     return MultiProviderEvaluationRunner(
         providers_config_path=str(temp_config_files["providers_config"]),
         system_config_path=str(temp_config_files["system_config"]),
@@ -140,8 +149,26 @@ def runner(
 
 
 @pytest.fixture
+def runner(
+    runner_template: MultiProviderEvaluationRunner, tmp_path: Path
+) -> MultiProviderEvaluationRunner:
+    """Create a MultiProviderEvaluationRunner instance for testing.
+
+    Each test gets its own copy of the module template with a fresh output
+    directory, so configs are loaded only once per module.
+    """
+    runner = copy.deepcopy(runner_template)
+    runner.output_base = tmp_path / "eval_output"
+    runner.output_base.mkdir()
+    return runner
+
+
+@pytest.fixture(scope="session")
 def sample_evaluation_summary() -> dict[str, Any]:
-    """Create a sample evaluation summary JSON for testing analysis."""
+    """Create a sample evaluation summary JSON for testing analysis.
+
+    Shared by all tests; treat it as read-only and deep-copy before mutating.
+    """
     return {
         "timestamp": "2025-01-01T12:00:00",
         "total_evaluations": 10,
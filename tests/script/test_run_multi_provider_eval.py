@@ -6,7 +6,6 @@
 import json
 import logging
 import multiprocessing
-import shutil
 import tempfile as temp_module
 from pathlib import Path
 from typing import Any
@@ -15,7 +14,11 @@ import pytest
 import yaml
 from pytest_mock import MockerFixture
 
-from script.run_multi_provider_eval import MultiProviderEvaluationRunner
+from script.run_multi_provider_eval import (
+    MultiProviderEvaluationRunner,
+    SafeYamlDumper,
+    SafeYamlLoader,
+)
 
 
 class TestMultiProviderEvaluationRunnerInit:
@@ -74,7 +77,7 @@ class TestMultiProviderEvaluationRunnerInit:
         }
         config_path = tmp_path / "config_with_workers.yaml"
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config_with_workers, f)
+            yaml.dump(config_with_workers, f, Dumper=SafeYamlDumper)
 
         runner = MultiProviderEvaluationRunner(
             providers_config_path=str(config_path),
@@ -99,7 +102,7 @@ class TestMultiProviderEvaluationRunnerInit:
         }
         config_path = tmp_path / "config_string.yaml"
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config_with_string, f)
+            yaml.dump(config_with_string, f, Dumper=SafeYamlDumper)
 
         runner = MultiProviderEvaluationRunner(
             providers_config_path=str(config_path),
@@ -125,7 +128,7 @@ class TestMultiProviderEvaluationRunnerInit:
         }
         config_path = tmp_path / "config_invalid.yaml"
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config_invalid, f)
+            yaml.dump(config_invalid, f, Dumper=SafeYamlDumper)
 
         with pytest.raises(ValueError, match="max_workers must be an integer"):
             MultiProviderEvaluationRunner(
@@ -170,7 +173,7 @@ class TestMultiProviderEvaluationRunnerInit:
         }
         system_path = tmp_path / "system_high_threads.yaml"
         with open(system_path, "w", encoding="utf-8") as f:
-            yaml.dump(system_config, f)
+            yaml.dump(system_config, f, Dumper=SafeYamlDumper)
 
         with caplog.at_level(logging.WARNING):
             runner = MultiProviderEvaluationRunner(
@@ -212,7 +215,7 @@ class TestMultiProviderEvaluationRunnerInit:
         }
         system_path = tmp_path / "system_reasonable.yaml"
         with open(system_path, "w", encoding="utf-8") as f:
-            yaml.dump(system_config, f)
+            yaml.dump(system_config, f, Dumper=SafeYamlDumper)
 
         with caplog.at_level(logging.WARNING):
             runner = MultiProviderEvaluationRunner(
@@ -265,7 +268,7 @@ class TestLoadYAML:
         """Test that YAML files not containing dictionaries are rejected."""
         list_yaml = tmp_path / "list.yaml"
         with open(list_yaml, "w", encoding="utf-8") as f:
-            yaml.dump(["item1", "item2", "item3"], f)
+            yaml.dump(["item1", "item2", "item3"], f, Dumper=SafeYamlDumper)
 
         with pytest.raises(ValueError, match="must be a mapping, got list"):
             runner._load_yaml(list_yaml)
@@ -316,7 +319,9 @@ class TestCreateModifiedSystemConfig:
         assert modified["llm"]["provider"] == original_llm_provider
         assert modified["llm"]["model"] == original_llm_model
 
-    def test_api_config_is_modified(self, temp_config_files: dict[str, Path]) -> None:
+    def test_api_config_is_modified(
+        self, temp_config_files: dict[str, Path], tmp_path: Path
+    ) -> None:
         """Test that API config is modified when API is enabled."""
         # Create system config with API enabled
         system_config = {
@@ -332,9 +337,9 @@ class TestCreateModifiedSystemConfig:
             },
             "output": {"output_dir": "./eval_output"},
         }
-        system_path = temp_config_files["system_config"].parent / "system_api.yaml"
+        system_path = tmp_path / "system_api.yaml"
         with open(system_path, "w", encoding="utf-8") as f:
-            yaml.dump(system_config, f)
+            yaml.dump(system_config, f, Dumper=SafeYamlDumper)
 
         runner = MultiProviderEvaluationRunner(
             providers_config_path=str(temp_config_files["providers_config"]),
@@ -361,29 +366,31 @@ class TestCreateTempSystemConfig:
     """Tests for _create_temp_system_config method."""
 
     def test_create_temp_config_file(
-        self, runner: MultiProviderEvaluationRunner
+        self,
+        runner: MultiProviderEvaluationRunner,
+        mocker: MockerFixture,
+        tmp_path: Path,
     ) -> None:
         """Test that a temporary config file is created."""
+        # Keep the temp file under tmp_path so pytest cleans it up
+        mocker.patch("tempfile.tempdir", str(tmp_path))
+
         temp_path = runner._create_temp_system_config(
             provider_id="openai",
             model="gpt-4o-mini",
         )
 
-        try:
-            assert temp_path.exists()
-            assert temp_path.suffix == ".yaml"
-            assert "openai" in temp_path.name
-            assert "gpt-4o-mini" in temp_path.name
-
-            # Verify content
-            with open(temp_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-            assert config["llm"]["provider"] == "openai"
-            assert config["llm"]["model"] == "gpt-4o-mini"
-        finally:
-            # Cleanup
-            if temp_path.exists():
-                temp_path.unlink()
+        assert temp_path.parent == tmp_path
+        assert temp_path.exists()
+        assert temp_path.suffix == ".yaml"
+        assert "openai" in temp_path.name
+        assert "gpt-4o-mini" in temp_path.name
+
+        # Verify content
+        with open(temp_path, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=SafeYamlLoader)
+        assert config["llm"]["provider"] == "openai"
+        assert config["llm"]["model"] == "gpt-4o-mini"
 
     def test_temp_config_cleanup_on_yaml_dump_failure(
         self,
@@ -426,40 +433,31 @@ class TestCreateTempSystemConfig:
         assert not created_temp_path.exists(), "Temp file should have been cleaned up"
 
     def test_temp_config_sanitizes_special_characters(
-        self, runner: MultiProviderEvaluationRunner
+        self,
+        runner: MultiProviderEvaluationRunner,
+        mocker: MockerFixture,
+        tmp_path: Path,
     ) -> None:
         """Test that special characters in provider_id and model are sanitized."""
+        mocker.patch("tempfile.tempdir", str(tmp_path))
+
         temp_path = runner._create_temp_system_config(
             provider_id="open..ai//test",
             model="gpt:4o-mini/special",
         )
 
-        try:
-            # Verify filename doesn't contain path separators or colons
-            # (except drive letter on Windows)
-            assert "/" not in temp_path.name
-            # On some systems, : might appear in drive letters on Windows, so we're lenient
-            # The key is that path traversal characters are neutralized
-            assert temp_path.exists()
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
+        # Verify filename doesn't contain path separators or colons
+        # (except drive letter on Windows)
+        assert "/" not in temp_path.name
+        # On some systems, : might appear in drive letters on Windows, so we're lenient
+        # The key is that path traversal characters are neutralized
+        assert temp_path.parent == tmp_path
+        assert temp_path.exists()
 
 
 class TestPathTraversalSecurity:
     """Tests for path traversal security."""
 
-    @pytest.fixture
-    def runner(
-        self, temp_config_files: dict[str, Path]
-    ) -> MultiProviderEvaluationRunner:
-        """Create a runner instance for testing."""
-        return MultiProviderEvaluationRunner(
-            providers_config_path=str(temp_config_files["providers_config"]),
-            system_config_path=str(temp_config_files["system_config"]),
-            eval_data_path=str(temp_config_files["eval_data"]),
-        )
-
     def test_path_traversal_blocked_in_provider_id(
         self, runner: MultiProviderEvaluationRunner, mocker: MockerFixture
     ) -> None:
@@ -484,10 +482,6 @@ class TestPathTraversalSecurity:
         assert ".." not in str(output_path)
         assert "/" not in str(output_path.relative_to(base_path).parts[0])
 
-        # Cleanup
-        if output_path.exists():
-            shutil.rmtree(output_path.parent, ignore_errors=True)
-
     def test_path_traversal_blocked_in_model(
         self, runner: MultiProviderEvaluationRunner, mocker: MockerFixture
     ) -> None:
@@ -511,10 +505,6 @@ class TestPathTraversalSecurity:
         # Verify dangerous characters are removed
         assert ".." not in str(output_path)
 
-        # Cleanup
-        if output_path.exists():
-            shutil.rmtree(output_path.parent.parent, ignore_errors=True)
-
 
 class TestRunSingleEvaluation:
     """Tests for _run_single_evaluation method."""
@@ -712,7 +702,7 @@ class TestBestModelAnalysis:
 
         assert output_path.exists()
         with open(output_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeYamlLoader)
 
         assert data["best_model"]["model"] == "model1"
         assert data["best_model"]["composite_score"] == 0.85
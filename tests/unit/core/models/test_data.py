@@ -7,6 +7,7 @@ from lightspeed_evaluation.core.models.data import (
     ConversationMetadata,
     DatasetMetadata,
     EvaluationData,
+    EvaluationRequest,
     EvaluationResult,
     JudgeScore,
     MetricResult,
@@ -954,3 +955,29 @@ class TestDatasetMetadata:
         restored = DatasetMetadata.model_validate(meta.model_dump(mode="json"))
         assert restored.team_product == "OLS"
         assert restored.additional_metadata == {"grade": "Gold"}
+
+
+class TestEvaluationRequest:
+    """Test cases for EvaluationRequest model."""
+
+    def test_for_turn_sets_computed_fields(self) -> None:
+        """Turn request exposes turn_id, framework and metric_name."""
+        turn = TurnData(turn_id="t1", query="Q")
+        conv = EvaluationData(conversation_group_id="conv", turns=[turn])
+
+        request = EvaluationRequest.for_turn(conv, "ragas:faithfulness", 0, turn)
+
+        assert request.turn_id == "t1"
+        assert request.framework == "ragas"
+        assert request.metric_name == "faithfulness"
+
+    def test_metric_name_keeps_extra_separators(self) -> None:
+        """Only the first colon separates framework from metric name."""
+        turn = TurnData(turn_id="t1", query="Q")
+        conv = EvaluationData(conversation_group_id="conv", turns=[turn])
+
+        request = EvaluationRequest.for_conversation(conv, "geval:custom:metric")
+
+        assert request.turn_id is None
+        assert request.framework == "geval"
+        assert request.metric_name == "custom:metric"
@@ -5,6 +5,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 from lightspeed_evaluation.core.script.manager import ScriptExecutionManager
 from lightspeed_evaluation.core.system.exceptions import ScriptExecutionError
@@ -178,3 +179,18 @@ class TestScriptExecutionManager:
                 manager.run_script(script_path)
         finally:
             script_path.unlink()
+
+    def test_run_script_inherits_environment(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test script sees the current process environment."""
+        mocker.patch.dict(os.environ, {"KUBECONFIG": "/tmp/test-kubeconfig"})
+        script_path = tmp_path / "check_env.sh"
+        script_path.write_text(
+            '#!/bin/bash\n[ "$KUBECONFIG" = "/tmp/test-kubeconfig" ]\n'
+        )
+        script_path.chmod(0o755)
+
+        manager = ScriptExecutionManager()
+
+        assert manager.run_script(script_path) is True
@@ -12,6 +12,7 @@ from lightspeed_evaluation.core.models import (
     EvaluationData,
     EvaluationRequest,
     EvaluationResult,
+    EvaluationScope,
     SystemConfig,
     TurnData,
 )
@@ -176,7 +177,9 @@ def mock_metrics_evaluator(mocker: MockerFixture) -> MetricsEvaluator:
     """Create a mock metrics evaluator."""
     evaluator = mocker.Mock(spec=MetricsEvaluator)
 
-    def evaluate_metric(request: EvaluationRequest) -> EvaluationResult:
+    def evaluate_metric(
+        request: EvaluationRequest, _evaluation_scope: EvaluationScope | None = None
+    ) -> EvaluationResult:
         """Mock evaluate_metric that returns a result based on metric."""
         return EvaluationResult(
             conversation_group_id=request.conv_data.conversation_group_id,
@@ -84,6 +84,26 @@ class TestMetricsEvaluator:
         assert result.agent_latency >= 0.0
         assert result.execution_time == result.evaluation_latency + result.agent_latency
 
+    def test_evaluate_metric_uses_given_scope(
+        self, evaluator: MetricsEvaluator
+    ) -> None:
+        """Test a caller-provided evaluation scope is passed to the handler."""
+        evaluator.handlers["nlp"].evaluate.return_value = (0.9, "Similar")
+
+        turn_data = TurnData(
+            turn_id="1", query="Q", response="R", expected_response="R"
+        )
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+        request = EvaluationRequest.for_turn(conv_data, "nlp:rouge", 0, turn_data)
+        scope = EvaluationScope(turn_idx=0, turn_data=turn_data)
+
+        result = evaluator.evaluate_metric(request, scope)
+
+        assert result is not None
+        evaluator.handlers["nlp"].evaluate.assert_called_once_with(
+            "rouge", conv_data, scope
+        )
+
     def test_evaluate_metric_turn_level_fail(self, evaluator: MetricsEvaluator) -> None:
         """Test evaluating turn-level metric that fails."""
         evaluator.handlers["ragas"].evaluate.return_value = (
@@ -253,11 +273,18 @@ class TestMetricsEvaluator:
         assert result.expected_response is None
 
     def test_evaluate_metric_skip_script_when_api_disabled(
-        self, evaluator: MetricsEvaluator, config_loader: ConfigLoader
+        self,
+        evaluator: MetricsEvaluator,
+        config_loader: ConfigLoader,
+        mock_script_manager: ScriptExecutionManager,
     ) -> None:
         """Test script metrics are skipped when API is disabled."""
         assert config_loader.system_config is not None
         config_loader.system_config.agents = None
+        # Agent availability is read once at construction
+        evaluator = MetricsEvaluator(
+            config_loader, evaluator.metric_manager, mock_script_manager
+        )
 
         turn_data = TurnData(turn_id="1", query="Q", response="R")
         conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
@@ -0,0 +1,181 @@
+# pylint: disable=protected-access
+
+"""Unit tests for ConversationProcessor metric evaluation dispatch."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lightspeed_evaluation.core.models import EvaluationData, TurnData
+from lightspeed_evaluation.core.system.loader import ConfigLoader
+from lightspeed_evaluation.pipeline.evaluation.evaluator import MetricsEvaluator
+from lightspeed_evaluation.pipeline.evaluation.processor import (
+    ConversationProcessor,
+    ProcessorComponents,
+)
+
+
+class TestConversationProcessorMetricEvaluation:
+    """Unit tests for evaluating the metrics of a turn."""
+
+    def test_evaluate_turn_shares_evaluation_scope(
+        self, processor: ConversationProcessor, mock_metrics_evaluator: MetricsEvaluator
+    ) -> None:
+        """Test all metrics of a turn are evaluated with one shared scope."""
+        turn_data = TurnData(turn_id="1", query="Q", response="A")
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+
+        processor._evaluate_turn(
+            conv_data, 0, turn_data, ["ragas:faithfulness", "custom:answer_correctness"]
+        )
+
+        calls = mock_metrics_evaluator.evaluate_metric.call_args_list
+        scope = calls[0][0][1]
+        assert scope.turn_idx == 0
+        assert scope.turn_data is turn_data
+        assert scope.is_conversation is False
+        assert calls[1][0][1] is scope
+
+    def test_evaluate_turn_concurrent_metrics_preserve_order(
+        self,
+        config_loader: ConfigLoader,
+        processor_components_pr: ProcessorComponents,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """Test concurrent metric evaluation keeps results in metric order."""
+        config_loader.system_config.core.max_metric_threads = 3
+        processor = ConversationProcessor(config_loader, processor_components_pr)
+        assert processor._metric_executor is not None
+
+        turn_data = TurnData(turn_id="1", query="Q", response="A")
+        turn_data.add_invalid_metric("ragas:faithfulness")
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+
+        turn_metrics = [
+            "custom:answer_correctness",
+            "ragas:faithfulness",
+            "ragas:context_recall",
+            "ragas:response_relevancy",
+        ]
+
+        try:
+            results = processor._evaluate_turn(conv_data, 0, turn_data, turn_metrics)
+        finally:
+            processor.close()
+
+        assert mock_metrics_evaluator.evaluate_metric.call_count == 3
+        assert [r.metric_identifier for r in results] == turn_metrics
+        assert [r.result for r in results] == ["PASS", "ERROR", "PASS", "PASS"]
+        assert processor._metric_executor is None
+
+    def test_evaluate_turn_concurrent_metric_exception(
+        self,
+        config_loader: ConfigLoader,
+        processor_components_pr: ProcessorComponents,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """Test evaluator exception in concurrent mode becomes an ERROR result."""
+        config_loader.system_config.core.max_metric_threads = 2
+        processor = ConversationProcessor(config_loader, processor_components_pr)
+        mock_metrics_evaluator.evaluate_metric.side_effect = [
+            RuntimeError("boom"),
+            RuntimeError("boom"),
+        ]
+
+        turn_data = TurnData(turn_id="1", query="Q", response="A")
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+
+        try:
+            results = processor._evaluate_turn(
+                conv_data,
+                0,
+                turn_data,
+                ["ragas:faithfulness", "custom:answer_correctness"],
+            )
+        finally:
+            processor.close()
+
+        assert [r.result for r in results] == ["ERROR", "ERROR"]
+        assert all(r.reason == "RuntimeError: boom" for r in results)
+        assert all(r.turn_id == "1" for r in results)
+
+    def test_evaluate_turns_concurrently_across_conversation_threads(
+        self,
+        config_loader: ConfigLoader,
+        processor_components_pr: ProcessorComponents,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """Test each conversation thread gets its own max_metric_threads budget."""
+        config_loader.system_config.core.max_threads = 2
+        config_loader.system_config.core.max_metric_threads = 2
+        processor = ConversationProcessor(config_loader, processor_components_pr)
+        evaluate_metric = mock_metrics_evaluator.evaluate_metric.side_effect
+        # Only released once two turns x two metrics are in flight together
+        barrier = threading.Barrier(4, timeout=5)
+
+        def wait_for_all(*args: object) -> object:
+            barrier.wait()
+            return evaluate_metric(*args)
+
+        mock_metrics_evaluator.evaluate_metric.side_effect = wait_for_all
+        turn_metrics = ["ragas:faithfulness", "custom:answer_correctness"]
+        turns = [TurnData(turn_id=str(i), query="Q", response="A") for i in (1, 2)]
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=turns)
+
+        try:
+            with ThreadPoolExecutor(max_workers=2) as conversation_pool:
+                futures = [
+                    conversation_pool.submit(
+                        processor._evaluate_turn, conv_data, idx, turn, turn_metrics
+                    )
+                    for idx, turn in enumerate(turns)
+                ]
+                results = [r for future in futures for r in future.result()]
+        finally:
+            processor.close()
+
+        assert mock_metrics_evaluator.evaluate_metric.call_count == 4
+        assert [r.result for r in results] == ["PASS"] * 4
+        assert [r.turn_id for r in results] == ["1", "1", "2", "2"]
+
+    def test_evaluate_turn_bounds_metrics_in_flight(
+        self,
+        config_loader: ConfigLoader,
+        processor_components_pr: ProcessorComponents,
+        mock_metrics_evaluator: MetricsEvaluator,
+    ) -> None:
+        """Test a turn never has more than max_metric_threads metrics in flight."""
+        config_loader.system_config.core.max_threads = 4
+        config_loader.system_config.core.max_metric_threads = 2
+        processor = ConversationProcessor(config_loader, processor_components_pr)
+        evaluate_metric = mock_metrics_evaluator.evaluate_metric.side_effect
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def track_in_flight(*args: object) -> object:
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return evaluate_metric(*args)
+
+        mock_metrics_evaluator.evaluate_metric.side_effect = track_in_flight
+        turn_data = TurnData(turn_id="1", query="Q", response="A")
+        conv_data = EvaluationData(conversation_group_id="test_conv", turns=[turn_data])
+        turn_metrics = [
+            "ragas:faithfulness",
+            "ragas:context_recall",
+            "ragas:response_relevancy",
+            "custom:answer_correctness",
+        ]
+
+        try:
+            results = processor._evaluate_turn(conv_data, 0, turn_data, turn_metrics)
+        finally:
+            processor.close()
+
+        assert [r.metric_identifier for r in results] == turn_metrics
+        assert peak[0] == 2